@@ -311,9 +311,9 @@ class ChecklistApp:
 
     def _render_search_results(self, results, query):
         """Render search results in task panel"""
-        # Clear existing widgets
-        for widget in self.task_panel.task_frame.winfo_children():
-            widget.destroy()
+        # Clear existing widgets; a queued render would overwrite the results
+        self.task_panel.cancel_pending_render()
+        self.task_panel.clear()
 
         if not results:
             import tkinter as tk
@@ -322,12 +322,13 @@ class ChecklistApp:
                            bg='white', fg='#95a5a6',
                            font=('Segoe UI', 12))
             empty.pack(pady=50)
-            return
+        else:
+            # Render each matching task using the original task index from the category
+            # so that toggle/delete/edit callbacks operate on the correct task
+            for result in results:
+                self.task_panel._render_task(result['task_idx'], result['task'])
 
-        # Render each matching task using the original task index from the category
-        # so that toggle/delete/edit callbacks operate on the correct task
-        for result in results:
-            self.task_panel._render_task(result['task_idx'], result['task'])
+        self.task_panel.layout_rows()
 
     def clear_search(self):
         """Clear search and show normal task list (Feature #2)"""
@@ -388,7 +389,7 @@ class ChecklistApp:
         """Show dialog to add new category"""
         def on_add(name):
             self.record_state("Add category")
-            new_id = max([c['id'] for c in self.data['categories']], default=0) + 1
+            new_id = max((c['id'] for c in self.data['categories']), default=0) + 1
             self.data['categories'].append({
                 'id': new_id,
                 'name': name,
@@ -147,6 +147,24 @@ class MarkdownExporter:
 
         return '\n'.join(lines)
 
+    def export_category_to_string(self, category_id: int) -> Optional[str]:
+        """
+        Export a single category to Markdown string
+
+        Args:
+            category_id: ID of category to export
+
+        Returns:
+            Markdown formatted string, or None if the category doesn't exist
+        """
+        category = self.checklist.get_category(category_id)
+        if not category:
+            return None
+
+        content = f"# {category.name}\n\n"
+        content += self._format_category(category)
+        return content
+
     def export_category(self, category_id: int, file_path: str) -> bool:
         """
         Export a single category to file
@@ -158,13 +176,10 @@ class MarkdownExporter:
         Returns:
             True if successful, False otherwise
         """
-        category = self.checklist.get_category(category_id)
-        if not category:
-            return False
-
         try:
-            content = f"# {category.name}\n\n"
-            content += self._format_category(category)
+            content = self.export_category_to_string(category_id)
+            if content is None:
+                return False
 
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
@@ -173,6 +188,26 @@ class MarkdownExporter:
             print(f"Error exporting category: {e}")
             return False
 
+    def export_completed_only_to_string(self) -> str:
+        """
+        Export only completed tasks to Markdown string
+
+        Returns:
+            Markdown formatted string
+        """
+        timestamp = datetime.now().strftime(Defaults.EXPORT_TIMESTAMP_FORMAT)
+        content = f"# Completed Tasks\n\n**Exported:** {timestamp}\n\n---\n\n"
+
+        for category in self.checklist.categories:
+            completed_tasks = category.get_completed_tasks()
+            if completed_tasks:
+                content += f"## {category.name}\n\n"
+                for task in completed_tasks:
+                    content += self._format_task(task) + "\n"
+                content += "\n"
+
+        return content
+
     def export_completed_only(self, file_path: str) -> bool:
         """
         Export only completed tasks
@@ -184,17 +219,7 @@ class MarkdownExporter:
             True if successful, False otherwise
         """
         try:
-            timestamp = datetime.now().strftime(Defaults.EXPORT_TIMESTAMP_FORMAT)
-            content = f"# Completed Tasks\n\n**Exported:** {timestamp}\n\n---\n\n"
-
-            for category in self.checklist.categories:
-                completed_tasks = category.get_completed_tasks()
-                if completed_tasks:
-                    content += f"## {category.name}\n\n"
-                    for task in completed_tasks:
-                        content += self._format_task(task) + "\n"
-                    content += "\n"
-
+            content = self.export_completed_only_to_string()
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
             return True
@@ -202,6 +227,26 @@ class MarkdownExporter:
             print(f"Error exporting completed tasks: {e}")
             return False
 
+    def export_pending_only_to_string(self) -> str:
+        """
+        Export only pending (incomplete) tasks to Markdown string
+
+        Returns:
+            Markdown formatted string
+        """
+        timestamp = datetime.now().strftime(Defaults.EXPORT_TIMESTAMP_FORMAT)
+        content = f"# Pending Tasks\n\n**Exported:** {timestamp}\n\n---\n\n"
+
+        for category in self.checklist.categories:
+            pending_tasks = category.get_pending_tasks()
+            if pending_tasks:
+                content += f"## {category.name}\n\n"
+                for task in pending_tasks:
+                    content += self._format_task(task) + "\n"
+                content += "\n"
+
+        return content
+
     def export_pending_only(self, file_path: str) -> bool:
         """
         Export only pending (incomplete) tasks
@@ -213,17 +258,7 @@ class MarkdownExporter:
             True if successful, False otherwise
         """
         try:
-            timestamp = datetime.now().strftime(Defaults.EXPORT_TIMESTAMP_FORMAT)
-            content = f"# Pending Tasks\n\n**Exported:** {timestamp}\n\n---\n\n"
-
-            for category in self.checklist.categories:
-                pending_tasks = category.get_pending_tasks()
-                if pending_tasks:
-                    content += f"## {category.name}\n\n"
-                    for task in pending_tasks:
-                        content += self._format_task(task) + "\n"
-                    content += "\n"
-
+            content = self.export_pending_only_to_string()
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
             return True
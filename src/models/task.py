@@ -10,6 +10,8 @@ from typing import List, Dict, Any, Optional
 class Subtask:
     """Represents a sub-task within a task"""
 
+    __slots__ = ('text', 'completed')
+
     def __init__(self, text: str, completed: bool = False):
         """
         Initialize a subtask
@@ -61,6 +63,9 @@ class Subtask:
 class Task:
     """Represents a task with optional notes and subtasks"""
 
+    __slots__ = ('text', 'completed', 'notes', 'subtasks', 'created',
+                 'priority', 'due_date', 'reminder')
+
     def __init__(
         self,
         text: str,
@@ -5,22 +5,32 @@ Handles user preferences and application settings
 
 import json
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable
 
 from ..utils.constants import Paths, Defaults
 
+# Built once at import; _get_default_settings copies it, giving each caller
+# its own recent_files list (the only mutable value)
+_DEFAULT_SETTINGS = {
+    'input_bg_color': Defaults.INPUT_BG_COLOR,
+    'recent_files': []
+}
+
 
 class SettingsManager:
     """Manages user settings and preferences"""
 
-    def __init__(self, settings_file: Optional[str] = None):
+    def __init__(self, settings_file: Optional[str] = None, autosave: bool = True):
         """
         Initialize settings manager
 
         Args:
             settings_file: Path to the settings JSON file (uses default if None)
+            autosave: Save after every change; if False, changes stay in
+                memory until save_settings() is called
         """
         self.settings_file = settings_file or Paths.SETTINGS_FILE
+        self.autosave = autosave
         self.settings = self._get_default_settings()
         self.load_settings()
 
@@ -31,10 +41,7 @@ class SettingsManager:
         Returns:
             Dictionary of default settings
         """
-        return {
-            'input_bg_color': Defaults.INPUT_BG_COLOR,
-            'recent_files': []
-        }
+        return {**_DEFAULT_SETTINGS, 'recent_files': []}
 
     def load_settings(self) -> bool:
         """
@@ -70,6 +77,21 @@ class SettingsManager:
             print(f"Error saving settings: {e}")
             return False
 
+    def reload(self) -> bool:
+        """
+        Discard in-memory settings and re-read them from file
+
+        Returns:
+            True if the file was loaded, False if defaults are in use
+        """
+        self.settings = self._get_default_settings()
+        return self.load_settings()
+
+    def _autosave(self) -> None:
+        """Save settings after a change, unless autosave is off"""
+        if self.autosave:
+            self.save_settings()
+
     def get_input_bg_color(self) -> str:
         """
         Get the input box background color
@@ -87,7 +109,7 @@ class SettingsManager:
             color: Color string (hex or name)
         """
         self.settings['input_bg_color'] = color
-        self.save_settings()
+        self._autosave()
 
     def get_recent_files(self) -> List[str]:
         """
@@ -118,7 +140,25 @@ class SettingsManager:
         recent_files = recent_files[:Defaults.MAX_RECENT_FILES]
 
         self.settings['recent_files'] = recent_files
-        self.save_settings()
+        self._autosave()
+
+    def add_recent_files_bulk(self, file_paths: Iterable[str]) -> None:
+        """
+        Add several files to the recent files list, saving once
+
+        Same result as calling add_recent_file for each path in order:
+        the last path ends up first.
+
+        Args:
+            file_paths: Paths to add
+        """
+        recent_files = list(file_paths)[::-1] + self.get_recent_files()
+
+        # dict.fromkeys drops duplicates while keeping the first occurrence
+        recent_files = list(dict.fromkeys(recent_files))[:Defaults.MAX_RECENT_FILES]
+
+        self.settings['recent_files'] = recent_files
+        self._autosave()
 
     def remove_recent_file(self, file_path: str) -> bool:
         """
@@ -135,7 +175,7 @@ class SettingsManager:
         if file_path in recent_files:
             recent_files.remove(file_path)
             self.settings['recent_files'] = recent_files
-            self.save_settings()
+            self._autosave()
             return True
 
         return False
@@ -143,7 +183,7 @@ class SettingsManager:
     def clear_recent_files(self) -> None:
         """Clear all recent files"""
         self.settings['recent_files'] = []
-        self.save_settings()
+        self._autosave()
 
     def get_recent_files_existing(self) -> List[str]:
         """
@@ -167,7 +207,7 @@ class SettingsManager:
 
         if removed_count > 0:
             self.settings['recent_files'] = existing_files
-            self.save_settings()
+            self._autosave()
 
         return removed_count
 
@@ -193,12 +233,12 @@ class SettingsManager:
             value: Setting value
         """
         self.settings[key] = value
-        self.save_settings()
+        self._autosave()
 
     def reset_to_defaults(self) -> None:
         """Reset all settings to default values"""
         self.settings = self._get_default_settings()
-        self.save_settings()
+        self._autosave()
 
     def get_all_settings(self) -> Dict[str, Any]:
         """
@@ -217,7 +257,7 @@ class SettingsManager:
             settings_dict: Dictionary of settings to import
         """
         self.settings.update(settings_dict)
-        self.save_settings()
+        self._autosave()
 
     def export_settings(self) -> Dict[str, Any]:
         """
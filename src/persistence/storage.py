@@ -15,14 +15,17 @@ from ..utils.constants import Paths, Defaults, FileTypes
 class ChecklistStorage:
     """Manages persistent storage of checklist data"""
 
-    def __init__(self, file_path: Optional[str] = None):
+    def __init__(self, file_path: Optional[str] = None, serializer=json):
         """
         Initialize storage manager
 
         Args:
             file_path: Path to the checklist JSON file (uses default if None)
+            serializer: Object providing json-style dump(obj, fp, **kwargs)
+                and load(fp) (default: the json module)
         """
         self.file_path = file_path or Paths.DEFAULT_CHECKLIST_FILE
+        self.serializer = serializer
 
     def save_checklist(self, checklist: Checklist) -> bool:
         """
@@ -37,7 +40,7 @@ class ChecklistStorage:
         try:
             data = checklist.to_dict()
             with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+                self.serializer.dump(data, f, indent=2)
             return True
         except Exception as e:
             print(f"Error saving checklist: {e}")
@@ -55,7 +58,7 @@ class ChecklistStorage:
 
         try:
             with open(self.file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = self.serializer.load(f)
             return Checklist.from_dict(data)
         except Exception as e:
             print(f"Error loading checklist: {e}")
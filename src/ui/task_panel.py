@@ -5,8 +5,61 @@ Handles scrollable task list with checkboxes, subtasks, and notes
 
 import tkinter as tk
 from tkinter import ttk
+# Geometry/style constants bound at module level; the render loop uses them
+# for every widget and this skips the tkinter module attribute lookup
+from tkinter import LEFT, RIGHT, BOTH, X, Y, FLAT, WORD, DISABLED
 import tkinter.font as tkfont
 from datetime import datetime
+from functools import lru_cache, partial
+
+from ..utils.constants import UI
+
+
+# Feature #3: Priority colors and symbols
+PRIORITY_COLORS = {
+    'high': '#e74c3c',    # Red
+    'medium': '#f39c12',  # Orange
+    'low': '#27ae60'      # Green
+}
+PRIORITY_SYMBOLS = {'high': '●', 'low': '○'}
+DEFAULT_BORDER_COLOR = '#3498db'
+
+# Tasks with more subtasks + notes than this render collapsed
+COLLAPSE_THRESHOLD = 3
+
+
+@lru_cache(maxsize=256)
+def _parse_due_date(due_date):
+    """
+    Parse a YYYY-MM-DD due date string
+
+    Args:
+        due_date: Due date string
+
+    Returns:
+        datetime for the due date, or None if the format is invalid
+    """
+    try:
+        return datetime.strptime(due_date, '%Y-%m-%d')
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _lighten(color, amount=0.25):
+    """
+    Blend a #rrggbb color towards white
+
+    Args:
+        color: Hex color string
+        amount: Fraction of the way to white (0-1)
+
+    Returns:
+        Lightened hex color string
+    """
+    r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    r, g, b = (round(c + (255 - c) * amount) for c in (r, g, b))
+    return f'#{r:02x}{g:02x}{b:02x}'
 
 
 class TaskPanel:
@@ -38,6 +91,34 @@ class TaskPanel:
         self.on_edit_subtask = on_edit_subtask
         self.on_set_reminder = on_set_reminder
 
+        # Pending render state - collapses bursts of render_tasks calls
+        # into a single rebuild per event loop turn
+        self._render_pending = None
+        self._pending_category = None
+
+        # Task row frames of the current render, laid out with place()
+        self._rows = []
+
+        # Prefix for the per-checkbox Tcl variable names; unique per panel
+        self._var_prefix = f'TaskPanelVar{id(self)}'
+
+        # ids of task dicts whose long subtask/note lists were expanded
+        self._expanded = set()
+
+        # Bound callbacks keyed by (callback name, task_idx[, subtask_idx]),
+        # reused across renders instead of building new closures each time
+        self._cmd_cache = {}
+
+        # Text styles for open/completed tasks and subtasks, built once and
+        # sharing one overstrike Font each instead of one Font per render
+        self._font_task_done = tkfont.Font(family='Segoe UI', size=11, overstrike=True)
+        self._font_subtask_done = tkfont.Font(family='Segoe UI', size=10, overstrike=True)
+        self._text_style_done = {'cursor': 'xterm', 'fg': '#7f8c8d',
+                                 'font': self._font_task_done}
+        self._text_style_open = {'cursor': 'xterm', 'font': UI.font('task')}
+        self._sub_text_style_done = {'fg': '#7f8c8d', 'font': self._font_subtask_done}
+        self._sub_text_style_open = {'fg': '#2c3e50', 'font': UI.font('subtask')}
+
         # Create task container
         self.container = tk.Frame(parent, bg='white')
 
@@ -47,9 +128,6 @@ class TaskPanel:
                                  command=self.canvas.yview)
 
         self.task_frame = tk.Frame(self.canvas, bg='white')
-        self.task_frame.bind('<Configure>',
-                           lambda e: self.canvas.configure(
-                               scrollregion=self.canvas.bbox('all')))
 
         self.canvas_window = self.canvas.create_window((0, 0),
                                                        window=self.task_frame,
@@ -59,43 +137,35 @@ class TaskPanel:
         # Update canvas width when window resizes
         self.canvas.bind('<Configure>', self._on_canvas_resize)
 
-        # Bind mouse wheel scrolling
-        self.canvas.bind('<Enter>', self._bind_mousewheel)
-        self.canvas.bind('<Leave>', self._unbind_mousewheel)
-
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True,
+        # Bind mouse wheel scrolling once on a panel-specific bindtag; the tag
+        # is added to the canvas and every widget rendered inside it, so the
+        # handlers apply to the whole panel without per-Enter/Leave rebinding
+        self._wheel_tag = f'TaskPanelWheel{id(self)}'
+        self.canvas.bind_class(self._wheel_tag, '<MouseWheel>', self._on_mousewheel)
+        self.canvas.bind_class(self._wheel_tag, '<Button-4>', self._on_mousewheel_linux)
+        self.canvas.bind_class(self._wheel_tag, '<Button-5>', self._on_mousewheel_linux)
+        self._add_wheel_tag(self.canvas)
+        self._add_wheel_tag(self.task_frame)
+
+        self.canvas.pack(side=LEFT, fill=BOTH, expand=True,
                         padx=20, pady=10)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-    def _bind_mousewheel(self, event):
-        """Bind mousewheel when mouse enters canvas"""
-        # Use bind() on canvas instead of bind_all() to avoid global binding conflicts
-        self.canvas.bind('<MouseWheel>', self._on_mousewheel)
-        self.canvas.bind('<Button-4>', self._on_mousewheel_linux)
-        self.canvas.bind('<Button-5>', self._on_mousewheel_linux)
-        # Also bind to the task_frame for events that occur on child widgets
-        self.task_frame.bind('<MouseWheel>', self._on_mousewheel)
-        self.task_frame.bind('<Button-4>', self._on_mousewheel_linux)
-        self.task_frame.bind('<Button-5>', self._on_mousewheel_linux)
-
-    def _unbind_mousewheel(self, event):
-        """Unbind mousewheel when mouse leaves canvas"""
-        self.canvas.unbind('<MouseWheel>')
-        self.canvas.unbind('<Button-4>')
-        self.canvas.unbind('<Button-5>')
-        self.task_frame.unbind('<MouseWheel>')
-        self.task_frame.unbind('<Button-4>')
-        self.task_frame.unbind('<Button-5>')
+        scrollbar.pack(side=RIGHT, fill=Y)
+
+    def _add_wheel_tag(self, widget):
+        """Append the panel's mousewheel bindtag to a widget"""
+        widget.bindtags(widget.bindtags() + (self._wheel_tag,))
+
+    def _add_wheel_tag_recursive(self, widget):
+        """Append the panel's mousewheel bindtag to a widget and its descendants"""
+        self._add_wheel_tag(widget)
+        for child in widget.winfo_children():
+            self._add_wheel_tag_recursive(child)
 
     def _on_mousewheel(self, event):
         """Handle mousewheel scroll (Windows/Mac)"""
         # On Windows, event.delta is a multiple of 120; on macOS it is +/-1.
-        # Normalize to a consistent scroll direction and apply a 3-unit speed.
-        if abs(event.delta) >= 120:
-            direction = -1 if event.delta > 0 else 1
-        else:
-            direction = -1 if event.delta > 0 else 1
-        self.canvas.yview_scroll(direction * 3, 'units')
+        # Only the sign matters: scroll 3 units in that direction either way.
+        self.canvas.yview_scroll(-3 if event.delta > 0 else 3, 'units')
 
     def _on_mousewheel_linux(self, event):
         """Handle mousewheel scroll (Linux)"""
@@ -105,6 +175,23 @@ class TaskPanel:
         elif event.num == 5:
             self.canvas.yview_scroll(3, 'units')
 
+    def _command(self, action, *args):
+        """
+        Get a cached callback that calls one of the on_* callbacks with args
+
+        Args:
+            action: Name of the callback attribute, e.g. 'on_toggle_task'
+            *args: Task index and optional subtask index
+
+        Returns:
+            functools.partial bound to the callback and arguments
+        """
+        key = (action,) + args
+        command = self._cmd_cache.get(key)
+        if command is None:
+            command = self._cmd_cache[key] = partial(getattr(self, action), *args)
+        return command
+
     def pack(self, **kwargs):
         """Pack the task panel container"""
         self.container.pack(**kwargs)
@@ -119,33 +206,94 @@ class TaskPanel:
 
     def render_tasks(self, category):
         """
-        Render tasks for a category
+        Schedule a render of the tasks for a category
+
+        Several calls in the same event (e.g. clearing completed tasks)
+        are coalesced into one rebuild once Tk is idle; the most recent
+        category wins.
 
         Args:
             category: Category dictionary with 'name' and 'tasks', or None
         """
-        # Clear existing widgets
-        for widget in self.task_frame.winfo_children():
-            widget.destroy()
+        self._pending_category = category
+        if self._render_pending is None:
+            self._render_pending = self.canvas.after_idle(self._flush_render)
+
+    def cancel_pending_render(self):
+        """Drop a scheduled render, e.g. before drawing search results"""
+        if self._render_pending is not None:
+            self.canvas.after_cancel(self._render_pending)
+            self._render_pending = None
+        self._pending_category = None
+
+    def _flush_render(self):
+        """Run the scheduled render"""
+        self._render_pending = None
+        category = self._pending_category
+        self._pending_category = None
+        self._do_render_tasks(category)
+
+    def _do_render_tasks(self, category):
+        """
+        Render tasks for a category immediately
+
+        Args:
+            category: Category dictionary with 'name' and 'tasks', or None
+        """
+        self.clear()
+
+        # Forget expansion state for tasks no longer shown, so a freed task
+        # dict cannot hand its id() to a new task
+        self._expanded.intersection_update(map(id, category['tasks'] if category else ()))
 
         if not category:
             empty = tk.Label(self.task_frame, text="No category selected",
                            bg='white', fg='#95a5a6',
-                           font=('Segoe UI', 14))
+                           font=UI.font('empty'))
             empty.pack(pady=50)
-            return
-
-        if not category['tasks']:
+        elif not category['tasks']:
             empty = tk.Label(self.task_frame,
                            text="No tasks yet\nStart typing below to add your first task!",
                            bg='white', fg='#95a5a6',
-                           font=('Segoe UI', 12))
+                           font=UI.font('empty_sub'))
             empty.pack(pady=50)
+        else:
+            # Render each task
+            for idx, task in enumerate(category['tasks']):
+                self._render_task(idx, task)
+
+        self.layout_rows()
+
+    def clear(self):
+        """Destroy all rendered task rows and empty-state labels"""
+        for widget in self.task_frame.winfo_children():
+            widget.destroy()
+        self._rows = []
+
+    def layout_rows(self):
+        """
+        Place the rendered task rows and update the canvas scrollregion
+
+        Must be called once after a batch of rows has been rendered with
+        _render_task; rows are not visible until it runs. Rows are stacked
+        with place() at measured y offsets, so Tk does not reflow every
+        sibling as rows are added, and the scrollregion is the resulting
+        total height rather than a bbox over all widgets.
+        """
+        self.task_frame.update_idletasks()
+
+        if not self._rows:
+            self.canvas.configure(scrollregion=self.canvas.bbox('all'))
             return
 
-        # Render each task
-        for idx, task in enumerate(category['tasks']):
-            self._render_task(idx, task)
+        y = 0
+        for row in self._rows:
+            height = row.winfo_reqheight()
+            row.place(x=10, y=y + 5, relwidth=1, width=-20, height=height)
+            y += height + 10
+
+        self.task_frame.configure(height=y)
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), y))
 
     def _render_task(self, idx, task):
         """
@@ -156,104 +304,84 @@ class TaskPanel:
             task: Task dictionary
         """
         task_widget = tk.Frame(self.task_frame, bg='#f8f9fa',
-                              relief=tk.FLAT, borderwidth=1)
-        task_widget.pack(fill=tk.X, pady=5, padx=10)
+                              relief=FLAT, borderwidth=1)
+        self._rows.append(task_widget)
 
-        # Feature #3: Priority-based left border color
+        # Read each task field once; the dict lookups below are in the
+        # per-task render path
+        text = task['text']
+        completed = task['completed']
         priority = task.get('priority', 'medium')
-        priority_colors = {
-            'high': '#e74c3c',    # Red
-            'medium': '#f39c12',  # Orange
-            'low': '#27ae60'      # Green
-        }
-        border_color = priority_colors.get(priority, '#3498db')
-        if task['completed']:
+        due_date = task.get('due_date')
+        subtasks = task.get('subtasks')
+        notes = task.get('notes')
+
+        # Feature #3: Priority-based left border color
+        show_priority = priority != 'medium' and not completed
+        border_color = PRIORITY_COLORS.get(priority, DEFAULT_BORDER_COLOR)
+        if completed:
             border_color = '#95a5a6'  # Gray for completed
 
         # Left border
         border = tk.Frame(task_widget, bg=border_color, width=3)
-        border.pack(side=tk.LEFT, fill=tk.Y)
+        border.pack(side=LEFT, fill=Y)
 
         # Main task content
         content = tk.Frame(task_widget, bg='#f8f9fa')
-        content.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=8)
+        content.pack(side=LEFT, fill=BOTH, expand=True, padx=10, pady=8)
 
         # Checkbox and text row
         main_row = tk.Frame(content, bg='#f8f9fa')
-        main_row.pack(fill=tk.X)
+        main_row.pack(fill=X)
 
         # Feature #3: Priority indicator
-        if priority != 'medium' and not task['completed']:
-            priority_symbols = {'high': '●', 'low': '○'}
-            priority_label = tk.Label(main_row, text=priority_symbols.get(priority, ''),
-                                     fg=priority_colors.get(priority, '#3498db'),
+        if show_priority:
+            priority_label = tk.Label(main_row, text=PRIORITY_SYMBOLS.get(priority, ''),
+                                     fg=PRIORITY_COLORS.get(priority, DEFAULT_BORDER_COLOR),
                                      bg='#f8f9fa', font=('Segoe UI', 10))
-            priority_label.pack(side=tk.LEFT, padx=(0, 2))
-
-        # Checkbox with explicit styling for visibility
-        var = tk.BooleanVar(value=task['completed'])
-        cb = tk.Checkbutton(main_row, variable=var, bg='#f8f9fa',
+            priority_label.pack(side=LEFT, padx=(0, 2))
+
+        # Checkbox with explicit styling for visibility. No BooleanVar: the
+        # toggle callback owns the state and the panel re-renders afterwards.
+        # Each checkbox still needs its own Tcl variable name - without one,
+        # Tk uses the widget's last path component ('!checkbutton'), which
+        # every task row shares
+        cb = tk.Checkbutton(main_row, bg='#f8f9fa',
                            activebackground='#f8f9fa',
                            selectcolor='white',
-                           command=lambda i=idx: self.on_toggle_task(i))
-        cb.pack(side=tk.LEFT)
-
-        # Button frame for task actions - pack FIRST so it gets space
-        btn_frame = tk.Frame(main_row, bg='#f8f9fa')
-        btn_frame.pack(side=tk.RIGHT, padx=(5, 0))
+                           variable=f'{self._var_prefix}_t{idx}',
+                           command=self._command('on_toggle_task', idx))
+        if completed:
+            cb.select()
+        else:
+            cb.deselect()
+        cb.pack(side=LEFT)
 
-        # Reminder button
+        # Task actions drawn on a single Canvas - pack FIRST so it gets space
+        actions = []
         if self.on_set_reminder:
             has_reminder = task.get('reminder') is not None
-            reminder_btn = tk.Button(btn_frame, text="🔔",
-                                    bg='#f39c12' if has_reminder else '#95a5a6',
-                                    fg='white',
-                                    relief=tk.FLAT, width=3,
-                                    font=('Segoe UI', 10),
-                                    command=lambda i=idx: self.on_set_reminder(i))
-            reminder_btn.pack(side=tk.LEFT, padx=1)
-
-        # Add sub-task button
-        add_sub_btn = tk.Button(btn_frame, text="+",
-                               bg='#3498db', fg='white',
-                               relief=tk.FLAT, width=3,
-                               font=('Segoe UI', 10, 'bold'),
-                               command=lambda i=idx: self.on_add_subtask(i))
-        add_sub_btn.pack(side=tk.LEFT, padx=1)
-
-        # Edit button
+            actions.append(("🔔", '#f39c12' if has_reminder else '#95a5a6',
+                            self._command('on_set_reminder', idx)))
+        actions.append(("+", '#3498db', self._command('on_add_subtask', idx)))
         if self.on_edit_task:
-            edit_btn = tk.Button(btn_frame, text="✎",
-                                bg='#9b59b6', fg='white',
-                                relief=tk.FLAT, width=3,
-                                font=('Segoe UI', 10),
-                                command=lambda i=idx: self.on_edit_task(i))
-            edit_btn.pack(side=tk.LEFT, padx=1)
-
-        # Delete button
-        del_btn = tk.Button(btn_frame, text="×",
-                          bg='#e74c3c', fg='white',
-                          relief=tk.FLAT, width=3,
-                          font=('Segoe UI', 10, 'bold'),
-                          command=lambda i=idx: self.on_delete_task(i))
-        del_btn.pack(side=tk.LEFT, padx=1)
+            actions.append(("✎", '#9b59b6', self._command('on_edit_task', idx)))
+        actions.append(("×", '#e74c3c', self._command('on_delete_task', idx)))
+
+        actions_canvas = self._render_actions(main_row, actions)
+        actions_canvas.pack(side=RIGHT, padx=(5, 0))
 
         # Text styling
-        text_style = {'cursor': 'xterm'}
-        if task['completed']:
-            text_style['fg'] = '#7f8c8d'
-            text_style['font'] = tkfont.Font(family='Segoe UI', size=11, overstrike=True)
-        else:
-            text_style['font'] = ('Segoe UI', 11)
+        text_style = self._text_style_done if completed else self._text_style_open
 
         # Calculate height based on number of lines in text
         # Bug fix: Account for both explicit newlines AND potential word-wrap lines
-        explicit_lines = task['text'].count('\n') + 1
+        explicit_lines = text.count('\n') + 1
 
         # Estimate additional lines from word wrap
         # Assume approximately 60 characters per visual line as a conservative estimate
         # This ensures long single-line text will have adequate height
-        text_length = len(task['text'])
+        text_length = len(text)
         chars_per_line = 60
         estimated_wrap_lines = max(1, (text_length + chars_per_line - 1) // chars_per_line)
 
@@ -263,47 +391,132 @@ class TaskPanel:
 
         # Use Text widget for selectable/copyable text - pack AFTER buttons
         task_text = tk.Text(main_row, height=line_count,
-                          bg='#f8f9fa', relief=tk.FLAT,
-                          wrap=tk.WORD, **text_style)
-        task_text.insert('1.0', task['text'])
-        task_text.config(state=tk.DISABLED)
-        task_text.pack(side=tk.LEFT, fill=tk.X, expand=True)
+                          bg='#f8f9fa', relief=FLAT,
+                          wrap=WORD, **text_style)
+        task_text.insert('1.0', text)
+        task_text.config(state=DISABLED)
+        task_text.pack(side=LEFT, fill=X, expand=True)
 
         # Feature #4: Due date display
-        due_date = task.get('due_date')
-        if due_date and not task['completed']:
-            try:
-                due_dt = datetime.strptime(due_date, '%Y-%m-%d')
-                days_left = (due_dt.date() - datetime.now().date()).days
-
-                if days_left < 0:
-                    due_color = '#e74c3c'  # Red - overdue
-                    due_text = f"⚠️ Overdue ({abs(days_left)}d)"
-                elif days_left == 0:
-                    due_color = '#e74c3c'  # Red - due today
-                    due_text = "📌 Due Today"
-                elif days_left <= 3:
-                    due_color = '#f39c12'  # Orange - due soon
-                    due_text = f"📌 Due in {days_left}d"
-                else:
-                    due_color = '#7f8c8d'  # Gray - due later
-                    due_text = f"📅 {due_dt.strftime('%b %d')}"
-
-                due_row = tk.Frame(content, bg='#f8f9fa')
-                due_row.pack(fill=tk.X, pady=(2, 0))
-                due_label = tk.Label(due_row, text=due_text, fg=due_color,
-                                    bg='#f8f9fa', font=('Segoe UI', 9))
-                due_label.pack(side=tk.LEFT, padx=25)
-            except ValueError:
-                pass  # Invalid date format
-
-        # Render subtasks
-        if task.get('subtasks'):
-            self._render_subtasks(content, idx, task['subtasks'])
-
-        # Render notes
-        if task.get('notes'):
-            self._render_notes(content, task['notes'])
+        # Invalid date formats parse to None and are not shown
+        due_dt = _parse_due_date(due_date) if due_date and not completed else None
+        if due_dt is not None:
+            days_left = (due_dt.date() - datetime.now().date()).days
+
+            if days_left < 0:
+                due_color = '#e74c3c'  # Red - overdue
+                due_text = f"⚠️ Overdue ({abs(days_left)}d)"
+            elif days_left == 0:
+                due_color = '#e74c3c'  # Red - due today
+                due_text = "📌 Due Today"
+            elif days_left <= 3:
+                due_color = '#f39c12'  # Orange - due soon
+                due_text = f"📌 Due in {days_left}d"
+            else:
+                due_color = '#7f8c8d'  # Gray - due later
+                due_text = f"📅 {due_dt.strftime('%b %d')}"
+
+            due_row = tk.Frame(content, bg='#f8f9fa')
+            due_row.pack(fill=X, pady=(2, 0))
+            due_label = tk.Label(due_row, text=due_text, fg=due_color,
+                                bg='#f8f9fa', font=('Segoe UI', 9))
+            due_label.pack(side=LEFT, padx=25)
+
+        # Render subtasks and notes; long ones stay collapsed behind a
+        # summary line until clicked, so scanning task titles stays cheap
+        detail_count = len(subtasks or ()) + len(notes or ())
+        if detail_count > COLLAPSE_THRESHOLD and id(task) not in self._expanded:
+            summary = tk.Label(content,
+                               text=f"▸ {len(subtasks or ())} subtasks, {len(notes or ())} notes",
+                               bg='#f8f9fa', fg='#3498db', font=UI.font('note'),
+                               anchor='w', cursor='hand2')
+            summary.pack(fill=X, padx=20, pady=(5, 0))
+            summary.bind('<Button-1>',
+                         lambda e, s=summary, c=content, i=idx, t=task:
+                         self._expand_task(s, c, i, t))
+        elif detail_count:
+            self._render_details(content, idx, subtasks, notes)
+
+        # Let the mouse wheel scroll the panel from anywhere over this task
+        self._add_wheel_tag_recursive(task_widget)
+
+    def _render_actions(self, parent, actions, size=26, gap=2):
+        """
+        Draw a row of action buttons as items on one Canvas
+
+        Each button is a rectangle and a glyph sharing a canvas tag, which
+        is far lighter than a tk.Button widget per action. Hovering a
+        button lightens its rectangle.
+
+        Args:
+            parent: Parent widget
+            actions: List of (glyph, color, callback) tuples
+            size: Width and height of each button in pixels
+            gap: Spacing between buttons in pixels
+
+        Returns:
+            The actions Canvas (not yet packed)
+        """
+        canvas = tk.Canvas(parent, width=len(actions) * (size + gap) - gap,
+                           height=size, bg='#f8f9fa', highlightthickness=0,
+                           bd=0, cursor='hand2')
+
+        for i, (glyph, color, callback) in enumerate(actions):
+            tag = f'action{i}'
+            x = i * (size + gap)
+            rect = canvas.create_rectangle(x, 0, x + size, size, fill=color,
+                                           outline='', tags=(tag,))
+            canvas.create_text(x + size // 2, size // 2, text=glyph,
+                               fill='white', font=('Segoe UI', 10, 'bold'),
+                               tags=(tag,))
+            canvas.tag_bind(tag, '<Button-1>', lambda e, cb=callback: cb())
+
+            # Hover feedback, as the tk.Button actions had
+            canvas.tag_bind(tag, '<Enter>',
+                            lambda e, r=rect, c=_lighten(color):
+                            canvas.itemconfigure(r, fill=c))
+            canvas.tag_bind(tag, '<Leave>',
+                            lambda e, r=rect, c=color:
+                            canvas.itemconfigure(r, fill=c))
+
+        return canvas
+
+    def _render_details(self, parent, task_idx, subtasks, notes):
+        """
+        Render the subtasks and notes of a task
+
+        Args:
+            parent: Parent widget
+            task_idx: Task index
+            subtasks: List of subtask dictionaries, or None
+            notes: List of note strings, or None
+
+        Returns:
+            List of the frames created
+        """
+        frames = []
+        if subtasks:
+            frames.append(self._render_subtasks(parent, task_idx, subtasks))
+        if notes:
+            frames.append(self._render_notes(parent, notes))
+        return frames
+
+    def _expand_task(self, summary, content, idx, task):
+        """
+        Replace a collapsed task's summary line with its subtasks and notes
+
+        Args:
+            summary: The summary Label to replace
+            content: The task's content frame
+            idx: Task index
+            task: Task dictionary
+        """
+        self._expanded.add(id(task))
+        summary.destroy()
+        for frame in self._render_details(content, idx, task.get('subtasks'),
+                                          task.get('notes')):
+            self._add_wheel_tag_recursive(frame)
+        self.layout_rows()
 
     def _render_subtasks(self, parent, task_idx, subtasks):
         """
@@ -313,60 +526,63 @@ class TaskPanel:
             parent: Parent widget
             task_idx: Task index
             subtasks: List of subtask dictionaries
+
+        Returns:
+            The subtasks frame
         """
         subtasks_frame = tk.Frame(parent, bg='#f8f9fa')
-        subtasks_frame.pack(fill=tk.X, padx=20, pady=5)
+        subtasks_frame.pack(fill=X, padx=20, pady=5)
 
         for sub_idx, subtask in enumerate(subtasks):
+            sub_completed = subtask['completed']
             sub_row = tk.Frame(subtasks_frame, bg='#f8f9fa')
-            sub_row.pack(fill=tk.X, pady=2)
+            sub_row.pack(fill=X, pady=2)
 
-            sub_var = tk.BooleanVar(value=subtask['completed'])
-            sub_cb = tk.Checkbutton(sub_row, variable=sub_var, bg='#f8f9fa',
+            # Unique Tcl variable per subtask checkbox (see _render_task)
+            sub_cb = tk.Checkbutton(sub_row, bg='#f8f9fa',
                                    activebackground='#f8f9fa',
                                    selectcolor='white',
-                                   command=lambda i=task_idx, si=sub_idx:
-                                   self.on_toggle_subtask(i, si))
-            sub_cb.pack(side=tk.LEFT)
+                                   variable=f'{self._var_prefix}_s{task_idx}_{sub_idx}',
+                                   command=self._command('on_toggle_subtask', task_idx, sub_idx))
+            if sub_completed:
+                sub_cb.select()
+            else:
+                sub_cb.deselect()
+            sub_cb.pack(side=LEFT)
 
             # Button frame for subtask actions - pack FIRST
             sub_btn_frame = tk.Frame(sub_row, bg='#f8f9fa')
-            sub_btn_frame.pack(side=tk.RIGHT)
+            sub_btn_frame.pack(side=RIGHT)
 
             # Edit subtask button
             if self.on_edit_subtask:
                 edit_sub_btn = tk.Button(sub_btn_frame, text="✎",
                                         bg='#9b59b6', fg='white',
-                                        relief=tk.FLAT, width=2,
+                                        relief=FLAT, width=2,
                                         font=('Segoe UI', 9),
-                                        command=lambda i=task_idx, si=sub_idx:
-                                        self.on_edit_subtask(i, si))
-                edit_sub_btn.pack(side=tk.LEFT, padx=1)
+                                        command=self._command('on_edit_subtask', task_idx, sub_idx))
+                edit_sub_btn.pack(side=LEFT, padx=1)
 
             # Delete sub-task button
             del_sub_btn = tk.Button(sub_btn_frame, text="×",
                                   bg='#e67e22', fg='white',
-                                  relief=tk.FLAT, width=2,
+                                  relief=FLAT, width=2,
                                   font=('Segoe UI', 9),
-                                  command=lambda i=task_idx, si=sub_idx:
-                                  self.on_delete_subtask(i, si))
-            del_sub_btn.pack(side=tk.LEFT, padx=1)
-
-            sub_text_style = {}
-            if subtask['completed']:
-                sub_text_style['fg'] = '#7f8c8d'
-                sub_text_style['font'] = tkfont.Font(family='Segoe UI', size=10, overstrike=True)
-            else:
-                sub_text_style['fg'] = '#2c3e50'
-                sub_text_style['font'] = ('Segoe UI', 10)
+                                  command=self._command('on_delete_subtask', task_idx, sub_idx))
+            del_sub_btn.pack(side=LEFT, padx=1)
+
+            sub_text_style = (self._sub_text_style_done if sub_completed
+                              else self._sub_text_style_open)
 
             # Use Label for subtasks with wraplength for long text
             # wraplength=400 allows text to wrap within the panel width
             sub_text = tk.Label(sub_row, text=f"↳ {subtask['text']}",
-                               bg='#f8f9fa', anchor='w', justify=tk.LEFT,
+                               bg='#f8f9fa', anchor='w', justify=LEFT,
                                wraplength=400,
                                **sub_text_style)
-            sub_text.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            sub_text.pack(side=LEFT, fill=X, expand=True)
+
+        return subtasks_frame
 
     def _render_notes(self, parent, notes):
         """
@@ -375,14 +591,19 @@ class TaskPanel:
         Args:
             parent: Parent widget
             notes: List of note strings
+
+        Returns:
+            The notes frame
         """
         notes_frame = tk.Frame(parent, bg='#f8f9fa')
-        notes_frame.pack(fill=tk.X, padx=20, pady=5)
+        notes_frame.pack(fill=X, padx=20, pady=5)
 
         for note in notes:
             note_label = tk.Label(notes_frame, text=f"• {note}",
                                 bg='#f8f9fa', fg='#7f8c8d',
-                                font=('Segoe UI', 9),
+                                font=UI.font('note'),
                                 anchor='w', cursor='xterm',
-                                wraplength=400, justify=tk.LEFT)
-            note_label.pack(fill=tk.X)
+                                wraplength=400, justify=LEFT)
+            note_label.pack(fill=X)
+
+        return notes_frame
@@ -3,6 +3,6 @@ Utilities and constants for Simple Checklist
 Shared configuration and helper functions
 """
 
-from .constants import *
+from .constants import Colors, Defaults, Paths, UI
 
 __all__ = ['Colors', 'Defaults', 'Paths', 'UI']
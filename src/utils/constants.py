@@ -8,6 +8,8 @@ import os
 
 class Colors:
     """UI color scheme"""
+    __slots__ = ()
+
     # Sidebar
     SIDEBAR_BG = '#2c3e50'
     SIDEBAR_ACTIVE = '#3498db'
@@ -40,6 +42,8 @@ class Colors:
 
 class UI:
     """UI dimensions and fonts"""
+    __slots__ = ()
+
     # Window
     WINDOW_WIDTH = 900
     WINDOW_HEIGHT = 600
@@ -61,6 +65,9 @@ class UI:
     FONT_EMPTY = (FONT_FAMILY, 14)
     FONT_EMPTY_SUB = (FONT_FAMILY, 12)
 
+    # Shared Font objects created from the FONT_* specs above, see font()
+    _fonts = {}
+
     # Padding
     PADDING_SMALL = 5
     PADDING_MEDIUM = 10
@@ -71,6 +78,32 @@ class UI:
     TASK_TEXT_WIDTH = 50
     SUBTASK_TEXT_WIDTH = 45
 
+    @classmethod
+    def font(cls, name):
+        """
+        Get the shared Font for a FONT_* spec, e.g. UI.font('title')
+
+        The Font is created on first use (a Tk root must exist by then) and
+        reused afterwards, so Tk resolves one named font instead of parsing
+        the tuple spec for every widget. Cached fonts belong to the Tk root
+        that existed when they were first requested; the app has only one.
+
+        Args:
+            name: Font name, the FONT_* suffix in any case
+
+        Returns:
+            tkinter.font.Font instance
+        """
+        key = name.lower()
+        font = cls._fonts.get(key)
+        if font is None:
+            import tkinter.font as tkfont
+            family, size, *style = getattr(cls, 'FONT_' + key.upper())
+            font = tkfont.Font(family=family, size=size,
+                               weight=style[0] if style else 'normal')
+            cls._fonts[key] = font
+        return font
+
 
 class Defaults:
     """Default values and settings"""
@@ -0,0 +1,102 @@
+"""
+Run the test suite with one process per test class
+Plain-unittest alternative to pytest-xdist; the test classes share no state
+
+Usage:
+    python tests/run_parallel.py [-j WORKERS]
+"""
+
+import argparse
+import io
+import os
+import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(TESTS_DIR)
+
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+
+def _iter_cases(suite):
+    """Yield every TestCase instance in a (nested) suite"""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_cases(test)
+        else:
+            yield test
+
+
+def collect_test_classes():
+    """
+    Find all test classes under tests/
+
+    Returns:
+        Sorted list of dotted names, e.g. 'tests.test_models.TestTask'. A
+        module that fails to import is listed by its module name, so the
+        worker re-imports it and reports the real import error
+    """
+    suite = unittest.defaultTestLoader.discover(TESTS_DIR, top_level_dir=ROOT_DIR)
+    names = set()
+    for case in _iter_cases(suite):
+        cls = type(case)
+        if cls.__name__ == '_FailedTest':
+            # The failed test's method name is the module's dotted name
+            names.add(case._testMethodName)
+        else:
+            names.add(f"{cls.__module__}.{cls.__name__}")
+    return sorted(names)
+
+
+def run_test_class(name):
+    """
+    Run one test class in the current process
+
+    Args:
+        name: Dotted name of the test class
+
+    Returns:
+        Tuple of (name, tests run, failures + errors, skipped, report text)
+    """
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+
+    stream = io.StringIO()
+    suite = unittest.defaultTestLoader.loadTestsFromName(name)
+    result = unittest.TextTestRunner(stream=stream, buffer=True, verbosity=1).run(suite)
+    problems = len(result.failures) + len(result.errors) + len(result.unexpectedSuccesses)
+    return name, result.testsRun, problems, len(result.skipped), stream.getvalue()
+
+
+def main(argv=None):
+    """
+    Run all test classes in a process pool and print a combined summary
+
+    Returns:
+        Process exit code: 0 if every class passed, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(),
+                        help='number of worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+
+    names = collect_test_classes()
+    total_run = total_problems = total_skipped = 0
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for name, run, problems, skipped, report in pool.map(run_test_class, names):
+            total_run += run
+            total_problems += problems
+            total_skipped += skipped
+            if problems:
+                print(f"FAIL {name}\n{report}")
+
+    print(f"Ran {total_run} tests in {len(names)} classes: "
+          f"{total_problems} failed, {total_skipped} skipped")
+    return 1 if total_problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,34 +7,44 @@ import unittest
 import sys
 import os
 import tempfile
+from contextlib import suppress
+from unittest.mock import patch, mock_open
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add src to path for imports (once, even if this module is imported again)
+_SRC_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if _SRC_ROOT not in sys.path:
+    sys.path.insert(0, _SRC_ROOT)
 
-from src.features.drag_drop import DragDropManager
-from src.features.export import MarkdownExporter
-from src.features.shortcuts import ShortcutManager, DefaultShortcuts
-from src.models.checklist import Checklist
-from src.models.category import Category
-from src.models.task import Task, Subtask
+# Feature and model modules are imported in each TestCase's setUpClass, so a
+# filtered run (e.g. -k TestShortcutManager) only imports what it uses
 
 
 class TestDragDropManager(unittest.TestCase):
     """Tests for DragDropManager class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Import the modules under test"""
+        from src.features.drag_drop import DragDropManager
+        from src.models.checklist import Checklist
+        from src.models.category import Category
+        cls.DragDropManager = DragDropManager
+        cls.Checklist = Checklist
+        cls.Category = Category
+
     def setUp(self):
         """Set up test fixtures"""
-        self.checklist = Checklist()
-        self.checklist.add_category(Category(1, "First"))
-        self.checklist.add_category(Category(2, "Second"))
-        self.checklist.add_category(Category(3, "Third"))
+        self.checklist = self.Checklist()
+        self.checklist.add_category(self.Category(1, "First"))
+        self.checklist.add_category(self.Category(2, "Second"))
+        self.checklist.add_category(self.Category(3, "Third"))
 
         self.reorder_called = False
 
         def on_reorder():
             self.reorder_called = True
 
-        self.manager = DragDropManager(self.checklist, on_reorder)
+        self.manager = self.DragDropManager(self.checklist, on_reorder)
 
     def test_init(self):
         """Test initialization"""
@@ -109,10 +119,16 @@ class TestDragDropManager(unittest.TestCase):
 class TestMarkdownExporter(unittest.TestCase):
     """Tests for MarkdownExporter class"""
 
-    def setUp(self):
-        """Set up test fixtures"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests (none mutate them)"""
+        from src.features.export import MarkdownExporter
+        from src.models.checklist import Checklist
+        from src.models.category import Category
+        from src.models.task import Task, Subtask
+
         # Create checklist with data
-        self.checklist = Checklist()
+        cls.checklist = Checklist()
 
         cat1 = Category(1, "Work")
         task1 = Task("Task 1", completed=True)
@@ -126,10 +142,30 @@ class TestMarkdownExporter(unittest.TestCase):
         task3 = Task("Task 3", completed=False)
         cat2.add_task(task3)
 
-        self.checklist.add_category(cat1)
-        self.checklist.add_category(cat2)
+        cls.checklist.add_category(cat1)
+        cls.checklist.add_category(cat2)
+
+        cls.exporter = MarkdownExporter(cls.checklist, "/path/to/checklist.json")
+
+        # Render each string export once; tests only scan the results
+        cls._rendered_with_meta = cls.exporter.export_to_string(include_metadata=True)
+        cls._rendered_no_meta = cls.exporter.export_to_string(include_metadata=False)
+
+        # One real file for the tests that must go through the filesystem
+        tmp = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md')
+        tmp.close()
+        cls._tmp_name = tmp.name
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temp file"""
+        with suppress(FileNotFoundError):
+            os.unlink(cls._tmp_name)
 
-        self.exporter = MarkdownExporter(self.checklist, "/path/to/checklist.json")
+    def _real_file(self):
+        """Truncate the shared temp file and return its path"""
+        open(self._tmp_name, 'w').close()
+        return self._tmp_name
 
     def test_init(self):
         """Test initialization"""
@@ -138,7 +174,7 @@ class TestMarkdownExporter(unittest.TestCase):
 
     def test_export_to_string_with_metadata(self):
         """Test exporting to string with metadata"""
-        result = self.exporter.export_to_string(include_metadata=True)
+        result = self._rendered_with_meta
 
         self.assertIn("# Checklist Export", result)
         self.assertIn("**Exported:**", result)
@@ -150,120 +186,96 @@ class TestMarkdownExporter(unittest.TestCase):
 
     def test_export_to_string_without_metadata(self):
         """Test exporting to string without metadata"""
-        result = self.exporter.export_to_string(include_metadata=False)
+        result = self._rendered_no_meta
 
         self.assertNotIn("# Checklist Export", result)
         self.assertIn("## Work", result)
         self.assertIn("## Personal", result)
 
-    def test_export_to_file(self):
-        """Test exporting to file"""
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md')
-        temp_file.close()
+    def _export_and_read(self, method, *args):
+        """
+        Run a file export method with open() mocked out
+
+        Returns:
+            Tuple of (method result, mocked open, content written)
+        """
+        with patch('src.features.export.open', mock_open()) as mocked:
+            result = getattr(self.exporter, method)(*args)
+        written = ''.join(c.args[0] for c in mocked.return_value.write.call_args_list)
+        return result, mocked, written
+
+    def test_file_exports(self):
+        """Test each file export method's result, target path and content"""
+        # (name, method, args, expected substrings, absent substrings)
+        cases = [
+            ("file", 'export_to_file', ('out.md',),
+             ("# Checklist Export", "## Work"), ()),
+            ("category", 'export_category', (1, 'out.md'),
+             ("# Work", "Task 1"), ("Personal",)),
+            ("completed_only", 'export_completed_only', ('out.md',),
+             ("# Completed Tasks", "[x] Task 1"), ("[ ] Task 2",)),
+            ("pending_only", 'export_pending_only', ('out.md',),
+             ("# Pending Tasks", "[ ] Task 2"), ("[x] Task 1",)),
+        ]
+
+        for name, method, args, present, absent in cases:
+            with self.subTest(name=name):
+                result, mocked, content = self._export_and_read(method, *args)
+
+                self.assertTrue(result)
+                mocked.assert_called_once_with('out.md', 'w', encoding='utf-8')
+                for text in present:
+                    self.assertIn(text, content)
+                for text in absent:
+                    self.assertNotIn(text, content)
 
-        try:
-            result = self.exporter.export_to_file(temp_file.name)
-            self.assertTrue(result)
-            self.assertTrue(os.path.exists(temp_file.name))
+    def test_export_category_invalid_id(self):
+        """Test exporting category with invalid ID"""
+        self.assertFalse(self.exporter.export_category(999, os.devnull))
 
-            # Read and verify
-            with open(temp_file.name, 'r', encoding='utf-8') as f:
-                content = f.read()
+    def test_export_to_real_file(self):
+        """Test exporting through the real filesystem"""
+        path = self._real_file()
+        self.assertTrue(self.exporter.export_to_file(path))
 
-            self.assertIn("# Checklist Export", content)
-            self.assertIn("## Work", content)
-        finally:
-            if os.path.exists(temp_file.name):
-                os.unlink(temp_file.name)
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        self.assertIn("# Checklist Export", content)
+        self.assertIn("## Work", content)
 
     def test_format_task_with_subtasks(self):
         """Test task formatting with subtasks"""
-        result = self.exporter.export_to_string(include_metadata=False)
+        result = self._rendered_no_meta
 
         self.assertIn("[x] Subtask 1", result)
         self.assertIn("[ ] Subtask 2", result)
 
     def test_format_task_with_notes(self):
         """Test task formatting with notes"""
-        result = self.exporter.export_to_string(include_metadata=False)
+        result = self._rendered_no_meta
         self.assertIn("Important", result)
 
-    def test_export_category(self):
-        """Test exporting single category"""
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md')
-        temp_file.close()
-
-        try:
-            result = self.exporter.export_category(1, temp_file.name)
-            self.assertTrue(result)
-
-            with open(temp_file.name, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            self.assertIn("# Work", content)
-            self.assertIn("Task 1", content)
-            self.assertNotIn("Personal", content)
-        finally:
-            if os.path.exists(temp_file.name):
-                os.unlink(temp_file.name)
-
-    def test_export_category_invalid_id(self):
-        """Test exporting category with invalid ID"""
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md')
-        temp_file.close()
-
-        try:
-            result = self.exporter.export_category(999, temp_file.name)
-            self.assertFalse(result)
-        finally:
-            if os.path.exists(temp_file.name):
-                os.unlink(temp_file.name)
-
-    def test_export_completed_only(self):
-        """Test exporting only completed tasks"""
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md')
-        temp_file.close()
-
-        try:
-            result = self.exporter.export_completed_only(temp_file.name)
-            self.assertTrue(result)
-
-            with open(temp_file.name, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            self.assertIn("# Completed Tasks", content)
-            self.assertIn("[x] Task 1", content)
-            self.assertNotIn("[ ] Task 2", content)
-        finally:
-            if os.path.exists(temp_file.name):
-                os.unlink(temp_file.name)
-
-    def test_export_pending_only(self):
-        """Test exporting only pending tasks"""
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md')
-        temp_file.close()
-
-        try:
-            result = self.exporter.export_pending_only(temp_file.name)
-            self.assertTrue(result)
-
-            with open(temp_file.name, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            self.assertIn("# Pending Tasks", content)
-            self.assertIn("[ ] Task 2", content)
-            self.assertNotIn("[x] Task 1", content)
-        finally:
-            if os.path.exists(temp_file.name):
-                os.unlink(temp_file.name)
+    def test_export_category_to_string(self):
+        """Test exporting single category to string"""
+        content = self.exporter.export_category_to_string(2)
+        self.assertIn("# Personal", content)
+        self.assertNotIn("Work", content)
+        self.assertIsNone(self.exporter.export_category_to_string(999))
 
     def test_get_export_preview(self):
         """Test getting export preview"""
         preview = self.exporter.get_export_preview(max_lines=5)
-        lines = preview.split('\n')
-        # Should have approximately 5 lines + ellipsis (may vary slightly)
-        self.assertLessEqual(len(lines), 10)
-        self.assertIn("...", preview)
+        full_lines = self._rendered_with_meta.split('\n')
+
+        def without_timestamp(lines):
+            # The export timestamp can tick over between the two renders
+            return [line for line in lines if not line.startswith("**Exported:**")]
+
+        # First 5 lines of the full export, then a count of the rest
+        self.assertEqual(without_timestamp(preview.split('\n')[:5]),
+                         without_timestamp(full_lines[:5]))
+        self.assertTrue(preview.endswith(f"... ({len(full_lines) - 5} more lines)"))
 
     def test_get_statistics(self):
         """Test getting export statistics"""
@@ -278,9 +290,15 @@ class TestMarkdownExporter(unittest.TestCase):
         self.assertIn('export_timestamp', stats)
 
 
+def _noop_cb(event):
+    """Shared do-nothing shortcut callback"""
+
+
 class MockWidget:
     """Mock widget for testing shortcuts"""
 
+    __slots__ = ('bindings', 'cursor')
+
     def __init__(self):
         self.bindings = {}
         self.cursor = None
@@ -303,10 +321,23 @@ class MockWidget:
 class TestShortcutManager(unittest.TestCase):
     """Tests for ShortcutManager class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the widget and manager shared by all tests"""
+        from src.features.shortcuts import ShortcutManager, DefaultShortcuts
+        cls.ShortcutManager = ShortcutManager
+        cls.DefaultShortcuts = DefaultShortcuts
+        cls._widget = MockWidget()
+        cls._manager = cls.ShortcutManager(cls._widget)
+
     def setUp(self):
-        """Set up test fixtures"""
-        self.widget = MockWidget()
-        self.manager = ShortcutManager(self.widget)
+        """Reset the shared widget and manager"""
+        self.widget = self._widget
+        self.manager = self._manager
+        self.manager.root_widget = self.widget
+        self.manager.clear_all()
+        self.widget.bindings.clear()
+        self.widget.cursor = None
         self.callback_called = False
 
     def test_init(self):
@@ -341,10 +372,7 @@ class TestShortcutManager(unittest.TestCase):
 
     def test_unregister_shortcut_all(self):
         """Test unregistering all callbacks for a key"""
-        def callback(event):
-            pass
-
-        self.manager.register_shortcut('<Control-s>', callback)
+        self.manager.register_shortcut('<Control-s>', _noop_cb)
         result = self.manager.unregister_shortcut('<Control-s>')
 
         self.assertTrue(result)
@@ -372,20 +400,14 @@ class TestShortcutManager(unittest.TestCase):
 
     def test_bind_all(self):
         """Test binding all shortcuts to widget"""
-        def callback(event):
-            pass
-
-        self.manager.register_shortcut('<Control-s>', callback)
+        self.manager.register_shortcut('<Control-s>', _noop_cb)
         self.manager.bind_all()
 
         self.assertIn('<Control-s>', self.widget.bindings)
 
     def test_unbind_all(self):
         """Test unbinding all shortcuts"""
-        def callback(event):
-            pass
-
-        self.manager.register_shortcut('<Control-s>', callback)
+        self.manager.register_shortcut('<Control-s>', _noop_cb)
         self.manager.bind_all()
         self.manager.unbind_all()
 
@@ -395,10 +417,7 @@ class TestShortcutManager(unittest.TestCase):
         """Test setting root widget"""
         new_widget = MockWidget()
 
-        def callback(event):
-            pass
-
-        self.manager.register_shortcut('<Control-s>', callback)
+        self.manager.register_shortcut('<Control-s>', _noop_cb)
         self.manager.set_root_widget(new_widget)
 
         self.assertEqual(self.manager.root_widget, new_widget)
@@ -406,11 +425,8 @@ class TestShortcutManager(unittest.TestCase):
 
     def test_get_all_shortcuts(self):
         """Test getting all shortcuts"""
-        def callback(event):
-            pass
-
-        self.manager.register_shortcut('<Control-s>', callback, "Save")
-        self.manager.register_shortcut('<Control-o>', callback, "Open")
+        self.manager.register_shortcut('<Control-s>', _noop_cb, "Save")
+        self.manager.register_shortcut('<Control-o>', _noop_cb, "Open")
 
         shortcuts = self.manager.get_all_shortcuts()
         self.assertEqual(len(shortcuts), 2)
@@ -418,10 +434,7 @@ class TestShortcutManager(unittest.TestCase):
 
     def test_clear_all(self):
         """Test clearing all shortcuts"""
-        def callback(event):
-            pass
-
-        self.manager.register_shortcut('<Control-s>', callback)
+        self.manager.register_shortcut('<Control-s>', _noop_cb)
         self.manager.bind_all()
         self.manager.clear_all()
 
@@ -430,11 +443,8 @@ class TestShortcutManager(unittest.TestCase):
 
     def test_create_help_text(self):
         """Test creating help text"""
-        def callback(event):
-            pass
-
-        self.manager.register_shortcut('<Control-s>', callback, "Save")
-        self.manager.register_shortcut('<Shift-Return>', callback, "Add task")
+        self.manager.register_shortcut('<Control-s>', _noop_cb, "Save")
+        self.manager.register_shortcut('<Shift-Return>', _noop_cb, "Add task")
 
         help_text = self.manager.create_help_text()
         self.assertIn("Keyboard Shortcuts", help_text)
@@ -453,10 +463,21 @@ class TestShortcutManager(unittest.TestCase):
 class TestDefaultShortcuts(unittest.TestCase):
     """Tests for DefaultShortcuts helper class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the widget and manager shared by all tests"""
+        from src.features.shortcuts import ShortcutManager, DefaultShortcuts
+        cls.ShortcutManager = ShortcutManager
+        cls.DefaultShortcuts = DefaultShortcuts
+        cls._widget = MockWidget()
+        cls._manager = cls.ShortcutManager(cls._widget)
+
     def setUp(self):
-        """Set up test fixtures"""
-        self.widget = MockWidget()
-        self.manager = ShortcutManager(self.widget)
+        """Reset the shared widget and manager"""
+        self.widget = self._widget
+        self.manager = self._manager
+        self.manager.clear_all()
+        self.widget.bindings.clear()
 
     def test_register_task_shortcuts(self):
         """Test registering task shortcuts"""
@@ -466,7 +487,7 @@ class TestDefaultShortcuts(unittest.TestCase):
             called.append('add')
 
         callbacks = {'add_task': add_task}
-        DefaultShortcuts.register_task_shortcuts(self.manager, callbacks)
+        self.DefaultShortcuts.register_task_shortcuts(self.manager, callbacks)
 
         self.assertTrue(self.manager.is_registered('<Shift-Return>'))
 
@@ -477,25 +498,19 @@ class TestDefaultShortcuts(unittest.TestCase):
         def switch_category(index):
             switched_to.append(index)
 
-        DefaultShortcuts.register_category_shortcuts(self.manager, switch_category)
+        before = self.manager.get_shortcut_count()
+        self.DefaultShortcuts.register_category_shortcuts(self.manager, switch_category)
 
         # Should have 9 category shortcuts
-        count = sum(1 for key in self.manager.bindings.keys() if 'Control-Key-' in key)
-        self.assertEqual(count, 9)
+        self.assertEqual(self.manager.get_shortcut_count() - before, 9)
 
     def test_register_all_defaults(self):
         """Test registering all default shortcuts"""
-        def add_task(event):
-            pass
-
-        def switch_category(index):
-            pass
-
-        task_callbacks = {'add_task': add_task}
-        DefaultShortcuts.register_all_defaults(
+        task_callbacks = {'add_task': _noop_cb}
+        self.DefaultShortcuts.register_all_defaults(
             self.manager,
             task_callbacks,
-            switch_category
+            _noop_cb
         )
 
         # Should have task shortcuts + 9 category shortcuts
@@ -503,4 +518,4 @@ class TestDefaultShortcuts(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    unittest.main()
+    unittest.main(buffer=True, failfast=os.environ.get("CI") == "true", verbosity=1)
@@ -3,31 +3,38 @@ Unit tests for model classes
 Tests for Task, Subtask, Category, and Checklist
 """
 
+import copy
 import unittest
 import sys
 import os
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add src to path for imports (once, even if this module is imported again)
+_SRC_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if _SRC_ROOT not in sys.path:
+    sys.path.insert(0, _SRC_ROOT)
 
 from src.models.task import Task, Subtask
 from src.models.category import Category
 from src.models.checklist import Checklist
 
+# Shared instances for tests that only add/remove them from containers.
+# Never toggle or edit these; build a fresh object when a test mutates one.
+_SUBTASK_A = Subtask("Write code")
+_SUBTASK_B = Subtask("Test code")
+_TASK_A = Task("Task 1")
+_TASK_B = Task("Task 2")
+
 
 class TestSubtask(unittest.TestCase):
     """Tests for Subtask class"""
 
     def test_create_subtask(self):
-        """Test creating a subtask"""
-        st = Subtask("Buy milk")
-        self.assertEqual(st.text, "Buy milk")
-        self.assertFalse(st.completed)
-
-    def test_create_completed_subtask(self):
-        """Test creating a completed subtask"""
-        st = Subtask("Buy milk", completed=True)
-        self.assertTrue(st.completed)
+        """Test creating pending and completed subtasks"""
+        for kwargs, completed in [({}, False), ({'completed': True}, True)]:
+            with self.subTest(completed=completed):
+                st = Subtask("Buy milk", **kwargs)
+                self.assertEqual(st.text, "Buy milk")
+                self.assertEqual(st.completed, completed)
 
     def test_toggle_completion(self):
         """Test toggling subtask completion"""
@@ -38,37 +45,32 @@ class TestSubtask(unittest.TestCase):
         st.toggle_completion()
         self.assertFalse(st.completed)
 
-    def test_to_dict(self):
-        """Test converting subtask to dictionary"""
-        st = Subtask("Buy milk", completed=True)
-        data = st.to_dict()
-        self.assertEqual(data['text'], "Buy milk")
-        self.assertTrue(data['completed'])
-
-    def test_from_dict(self):
-        """Test creating subtask from dictionary"""
-        data = {'text': 'Buy milk', 'completed': True}
-        st = Subtask.from_dict(data)
-        self.assertEqual(st.text, "Buy milk")
-        self.assertTrue(st.completed)
+    def test_slots(self):
+        """Test that subtasks use __slots__ instead of a per-instance dict"""
+        self.assertFalse(hasattr(Subtask("Buy milk"), '__dict__'))
+        with self.assertRaises(AttributeError):
+            Subtask("Buy milk").unknown = True
 
 
 class TestTask(unittest.TestCase):
     """Tests for Task class"""
 
     def test_create_task(self):
-        """Test creating a task"""
-        task = Task("Complete project")
-        self.assertEqual(task.text, "Complete project")
-        self.assertFalse(task.completed)
-        self.assertEqual(len(task.notes), 0)
-        self.assertEqual(len(task.subtasks), 0)
-        self.assertIsNotNone(task.created)
-
-    def test_create_task_with_notes(self):
-        """Test creating a task with notes"""
-        task = Task("Complete project", notes=["Important", "Urgent"])
-        self.assertEqual(len(task.notes), 2)
+        """Test creating a task with and without notes"""
+        for notes in [None, ["Important", "Urgent"]]:
+            with self.subTest(notes=notes):
+                task = Task("Complete project", notes=notes)
+                self.assertEqual(task.text, "Complete project")
+                self.assertFalse(task.completed)
+                self.assertEqual(task.notes, notes or [])
+                self.assertEqual(len(task.subtasks), 0)
+                self.assertIsNotNone(task.created)
+
+    def test_slots(self):
+        """Test that tasks use __slots__ instead of a per-instance dict"""
+        self.assertFalse(hasattr(Task("Buy milk"), '__dict__'))
+        with self.assertRaises(AttributeError):
+            Task("Buy milk").unknown = True
 
     def test_toggle_completion(self):
         """Test toggling task completion"""
@@ -80,19 +82,15 @@ class TestTask(unittest.TestCase):
     def test_add_subtask(self):
         """Test adding subtasks"""
         task = Task("Complete project")
-        st1 = Subtask("Write code")
-        st2 = Subtask("Test code")
-        task.add_subtask(st1)
-        task.add_subtask(st2)
+        task.add_subtask(_SUBTASK_A)
+        task.add_subtask(_SUBTASK_B)
         self.assertEqual(task.get_subtask_count(), 2)
 
     def test_remove_subtask(self):
         """Test removing subtasks"""
         task = Task("Complete project")
-        st1 = Subtask("Write code")
-        st2 = Subtask("Test code")
-        task.add_subtask(st1)
-        task.add_subtask(st2)
+        task.add_subtask(_SUBTASK_A)
+        task.add_subtask(_SUBTASK_B)
 
         removed = task.remove_subtask(0)
         self.assertEqual(removed.text, "Write code")
@@ -137,33 +135,6 @@ class TestTask(unittest.TestCase):
         task.subtasks[1].toggle_completion()
         self.assertTrue(task.is_fully_completed())
 
-    def test_to_dict(self):
-        """Test converting task to dictionary"""
-        task = Task("Complete project", notes=["Important"])
-        task.add_subtask(Subtask("Write code"))
-        data = task.to_dict()
-
-        self.assertEqual(data['text'], "Complete project")
-        self.assertFalse(data['completed'])
-        self.assertEqual(len(data['notes']), 1)
-        self.assertEqual(len(data['subtasks']), 1)
-
-    def test_from_dict(self):
-        """Test creating task from dictionary"""
-        data = {
-            'text': 'Complete project',
-            'completed': True,
-            'notes': ['Important'],
-            'subtasks': [{'text': 'Write code', 'completed': False}],
-            'created': '2025-01-01T10:00:00'
-        }
-        task = Task.from_dict(data)
-
-        self.assertEqual(task.text, "Complete project")
-        self.assertTrue(task.completed)
-        self.assertEqual(len(task.notes), 1)
-        self.assertEqual(task.get_subtask_count(), 1)
-
 
 class TestCategory(unittest.TestCase):
     """Tests for Category class"""
@@ -178,19 +149,15 @@ class TestCategory(unittest.TestCase):
     def test_add_task(self):
         """Test adding tasks"""
         cat = Category(1, "Work")
-        task1 = Task("Task 1")
-        task2 = Task("Task 2")
-        cat.add_task(task1)
-        cat.add_task(task2)
+        cat.add_task(_TASK_A)
+        cat.add_task(_TASK_B)
         self.assertEqual(cat.get_task_count(), 2)
 
     def test_remove_task(self):
         """Test removing tasks"""
         cat = Category(1, "Work")
-        task1 = Task("Task 1")
-        task2 = Task("Task 2")
-        cat.add_task(task1)
-        cat.add_task(task2)
+        cat.add_task(_TASK_A)
+        cat.add_task(_TASK_B)
 
         removed = cat.remove_task(0)
         self.assertEqual(removed.text, "Task 1")
@@ -199,89 +166,49 @@ class TestCategory(unittest.TestCase):
     def test_get_task(self):
         """Test getting a task by index"""
         cat = Category(1, "Work")
-        task1 = Task("Task 1")
-        cat.add_task(task1)
+        cat.add_task(_TASK_A)
 
         retrieved = cat.get_task(0)
         self.assertEqual(retrieved.text, "Task 1")
 
-    def test_get_completed_tasks(self):
-        """Test getting completed tasks"""
-        cat = Category(1, "Work")
-        task1 = Task("Task 1", completed=True)
-        task2 = Task("Task 2", completed=False)
-        task3 = Task("Task 3", completed=True)
-        cat.add_task(task1)
-        cat.add_task(task2)
-        cat.add_task(task3)
-
-        completed = cat.get_completed_tasks()
-        self.assertEqual(len(completed), 2)
-
-    def test_get_pending_tasks(self):
-        """Test getting pending tasks"""
+    def test_category_aggregations(self):
+        """Test completed/pending filters, completion percentage and clearing"""
         cat = Category(1, "Work")
-        task1 = Task("Task 1", completed=True)
-        task2 = Task("Task 2", completed=False)
-        task3 = Task("Task 3", completed=False)
-        cat.add_task(task1)
-        cat.add_task(task2)
-        cat.add_task(task3)
-
-        pending = cat.get_pending_tasks()
-        self.assertEqual(len(pending), 2)
-
-    def test_clear_completed(self):
-        """Test clearing completed tasks"""
-        cat = Category(1, "Work")
-        cat.add_task(Task("Task 1", completed=True))
-        cat.add_task(Task("Task 2", completed=False))
-        cat.add_task(Task("Task 3", completed=True))
+        for i, completed in enumerate([True, False, True, True], 1):
+            cat.add_task(Task(f"Task {i}", completed=completed))
 
-        count = cat.clear_completed()
-        self.assertEqual(count, 2)
-        self.assertEqual(cat.get_task_count(), 1)
+        with self.subTest("completed_tasks"):
+            self.assertEqual(len(cat.get_completed_tasks()), 3)
+        with self.subTest("pending_tasks"):
+            self.assertEqual(len(cat.get_pending_tasks()), 1)
+        with self.subTest("completion_percentage"):
+            self.assertEqual(cat.get_completion_percentage(), 75.0)
 
-    def test_get_completion_percentage(self):
-        """Test getting completion percentage"""
-        cat = Category(1, "Work")
-        cat.add_task(Task("Task 1", completed=True))
-        cat.add_task(Task("Task 2", completed=False))
-        cat.add_task(Task("Task 3", completed=True))
-        cat.add_task(Task("Task 4", completed=True))
-
-        percentage = cat.get_completion_percentage()
-        self.assertEqual(percentage, 75.0)
-
-    def test_to_dict(self):
-        """Test converting category to dictionary"""
-        cat = Category(1, "Work")
-        cat.add_task(Task("Task 1"))
-        data = cat.to_dict()
-
-        self.assertEqual(data['id'], 1)
-        self.assertEqual(data['name'], "Work")
-        self.assertEqual(len(data['tasks']), 1)
-
-    def test_from_dict(self):
-        """Test creating category from dictionary"""
-        data = {
-            'id': 1,
-            'name': 'Work',
-            'tasks': [
-                {'text': 'Task 1', 'completed': False, 'created': '2025-01-01T10:00:00'}
-            ]
-        }
-        cat = Category.from_dict(data)
-
-        self.assertEqual(cat.id, 1)
-        self.assertEqual(cat.name, "Work")
-        self.assertEqual(cat.get_task_count(), 1)
+        # Mutates the category, so it runs last
+        with self.subTest("clear_completed"):
+            self.assertEqual(cat.clear_completed(), 3)
+            self.assertEqual(cat.get_task_count(), 1)
 
 
 class TestChecklist(unittest.TestCase):
     """Tests for Checklist class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build one checklist shared by the read-only tests"""
+        cls._template = Checklist()
+        work = Category(1, "Work")
+        work.add_task(Task("Task 1", completed=True))
+        work.add_task(Task("Task 2", completed=False))
+        personal = Category(2, "Personal")
+        personal.add_task(Task("Task 3", completed=True))
+        cls._template.add_category(work)
+        cls._template.add_category(personal)
+
+    def _mutable_checklist(self):
+        """Return a private copy of the template for tests that modify it"""
+        return copy.deepcopy(self._template)
+
     def test_create_checklist(self):
         """Test creating a checklist"""
         cl = Checklist()
@@ -299,11 +226,7 @@ class TestChecklist(unittest.TestCase):
 
     def test_remove_category(self):
         """Test removing categories"""
-        cl = Checklist()
-        cat1 = Category(1, "Work")
-        cat2 = Category(2, "Personal")
-        cl.add_category(cat1)
-        cl.add_category(cat2)
+        cl = self._mutable_checklist()
 
         removed = cl.remove_category(1)
         self.assertEqual(removed.name, "Work")
@@ -311,18 +234,12 @@ class TestChecklist(unittest.TestCase):
 
     def test_get_category(self):
         """Test getting category by ID"""
-        cl = Checklist()
-        cat1 = Category(1, "Work")
-        cl.add_category(cat1)
-
-        retrieved = cl.get_category(1)
+        retrieved = self._template.get_category(1)
         self.assertEqual(retrieved.name, "Work")
 
     def test_get_current_category(self):
         """Test getting current category"""
-        cl = Checklist()
-        cat1 = Category(1, "Work")
-        cl.add_category(cat1)
+        cl = self._mutable_checklist()
 
         # No current category
         self.assertIsNone(cl.get_current_category())
@@ -334,9 +251,7 @@ class TestChecklist(unittest.TestCase):
 
     def test_set_current_category(self):
         """Test setting current category"""
-        cl = Checklist()
-        cat1 = Category(1, "Work")
-        cl.add_category(cat1)
+        cl = self._mutable_checklist()
 
         # Valid ID
         result = cl.set_current_category(1)
@@ -361,86 +276,90 @@ class TestChecklist(unittest.TestCase):
 
     def test_reorder_categories(self):
         """Test reordering categories"""
-        cl = Checklist()
-        cat1 = Category(1, "First")
-        cat2 = Category(2, "Second")
-        cat3 = Category(3, "Third")
-        cl.add_category(cat1)
-        cl.add_category(cat2)
-        cl.add_category(cat3)
+        # Three categories, so a plain swap of the endpoints would fail
+        cl = self._mutable_checklist()
+        cl.add_category(Category(3, "Shopping"))
 
         # Move first to last
         result = cl.reorder_categories(0, 2)
         self.assertTrue(result)
-        self.assertEqual(cl.categories[0].name, "Second")
-        self.assertEqual(cl.categories[2].name, "First")
+        self.assertEqual([c.name for c in cl.categories],
+                         ["Personal", "Shopping", "Work"])
 
     def test_get_category_by_index(self):
         """Test getting category by index"""
-        cl = Checklist()
-        cat1 = Category(1, "Work")
-        cl.add_category(cat1)
-
-        retrieved = cl.get_category_by_index(0)
+        retrieved = self._template.get_category_by_index(0)
         self.assertEqual(retrieved.name, "Work")
 
     def test_get_total_task_count(self):
         """Test getting total task count"""
-        cl = Checklist()
-        cat1 = Category(1, "Work")
-        cat1.add_task(Task("Task 1"))
-        cat1.add_task(Task("Task 2"))
-        cat2 = Category(2, "Personal")
-        cat2.add_task(Task("Task 3"))
-        cl.add_category(cat1)
-        cl.add_category(cat2)
-
-        self.assertEqual(cl.get_total_task_count(), 3)
+        self.assertEqual(self._template.get_total_task_count(), 3)
 
     def test_get_total_completed_count(self):
         """Test getting total completed count"""
-        cl = Checklist()
-        cat1 = Category(1, "Work")
-        cat1.add_task(Task("Task 1", completed=True))
-        cat1.add_task(Task("Task 2", completed=False))
-        cat2 = Category(2, "Personal")
-        cat2.add_task(Task("Task 3", completed=True))
-        cl.add_category(cat1)
-        cl.add_category(cat2)
+        self.assertEqual(self._template.get_total_completed_count(), 2)
 
-        self.assertEqual(cl.get_total_completed_count(), 2)
 
-    def test_to_dict(self):
-        """Test converting checklist to dictionary"""
-        cl = Checklist()
-        cat1 = Category(1, "Work")
-        cat1.add_task(Task("Task 1"))
-        cl.add_category(cat1)
-        cl.set_current_category(1)
+def _make_task():
+    """Completed task with a note and a subtask"""
+    task = Task("Complete project", completed=True, notes=["Important"])
+    task.add_subtask(Subtask("Write code"))
+    return task
 
-        data = cl.to_dict()
-        self.assertEqual(len(data['categories']), 1)
-        self.assertEqual(data['current_category'], 1)
-
-    def test_from_dict(self):
-        """Test creating checklist from dictionary"""
-        data = {
-            'categories': [
-                {
-                    'id': 1,
-                    'name': 'Work',
-                    'tasks': [
-                        {'text': 'Task 1', 'completed': False, 'created': '2025-01-01T10:00:00'}
-                    ]
-                }
-            ],
-            'current_category': 1
-        }
-        cl = Checklist.from_dict(data)
 
-        self.assertEqual(cl.get_category_count(), 1)
-        self.assertEqual(cl.current_category_id, 1)
+def _make_category():
+    """Category holding one task"""
+    cat = Category(1, "Work")
+    cat.add_task(_make_task())
+    return cat
+
+
+def _make_checklist():
+    """Checklist with one current category"""
+    cl = Checklist()
+    cl.add_category(_make_category())
+    cl.set_current_category(1)
+    return cl
+
+
+class TestRoundTrip(unittest.TestCase):
+    """to_dict/from_dict round trips for every model class"""
+
+    CASES = [
+        (Subtask, lambda: Subtask("Buy milk", completed=True)),
+        (Task, _make_task),
+        (Category, _make_category),
+        (Checklist, _make_checklist),
+    ]
+
+    def test_roundtrip(self):
+        """Test that from_dict(to_dict()) reproduces each model"""
+        for cls, factory in self.CASES:
+            with self.subTest(cls=cls.__name__):
+                data = factory().to_dict()
+                self.assertEqual(cls.from_dict(data).to_dict(), data)
+
+    def test_from_minimal_dict(self):
+        """Test that from_dict fills defaults for legacy dicts missing fields"""
+        st = Subtask.from_dict({'text': 'Buy milk'})
+        self.assertFalse(st.completed)
+
+        task = Task.from_dict({'text': 'x', 'completed': False})
+        self.assertEqual(task.text, 'x')
+        self.assertFalse(task.completed)
+        self.assertEqual(task.notes, [])
+        self.assertEqual(task.subtasks, [])
+        self.assertEqual(task.priority, 'medium')
+        self.assertIsNone(task.due_date)
+        self.assertIsNone(task.reminder)
+
+        cat = Category.from_dict({'id': 1, 'name': 'Work'})
+        self.assertEqual(cat.tasks, [])
+
+        cl = Checklist.from_dict({})
+        self.assertEqual(cl.categories, [])
+        self.assertIsNone(cl.current_category_id)
 
 
 if __name__ == '__main__':
-    unittest.main()
+    unittest.main(buffer=True, failfast=os.environ.get("CI") == "true", verbosity=1)
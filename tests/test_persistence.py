@@ -7,11 +7,15 @@ import unittest
 import sys
 import os
 import tempfile
+import shutil
 import json
 from datetime import datetime
+from functools import lru_cache
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add src to path for imports (once, even if this module is imported again)
+_SRC_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if _SRC_ROOT not in sys.path:
+    sys.path.insert(0, _SRC_ROOT)
 
 from src.persistence.storage import ChecklistStorage
 from src.persistence.settings import SettingsManager
@@ -20,27 +24,67 @@ from src.models.category import Category
 from src.models.task import Task, Subtask
 
 
+@lru_cache(maxsize=None)
+def _serialized_empty_checklist():
+    """JSON bytes of an empty Checklist, as save_checklist writes them"""
+    return json.dumps(Checklist().to_dict(), indent=2).encode('utf-8')
+
+
+class _InMemorySerializer:
+    """Serializer that keeps saved dicts in memory, keyed by file name
+
+    Lets the storage tests cover the model <-> dict round trip without
+    paying for the JSON codec; TestChecklistStorageJSON covers real JSON.
+    """
+
+    _saved = {}
+
+    @classmethod
+    def dump(cls, obj, fp, **kwargs):
+        cls._saved[fp.name] = obj
+
+    @classmethod
+    def load(cls, fp):
+        return cls._saved[fp.name]
+
+
+def _make_checklist_with_data():
+    """Checklist with one category, task, note and subtask"""
+    checklist = Checklist()
+    cat1 = Category(1, "Work")
+    task1 = Task("Complete project", completed=False, notes=["Important"])
+    task1.add_subtask(Subtask("Write code"))
+    cat1.add_task(task1)
+    checklist.add_category(cat1)
+    checklist.set_current_category(1)
+    return checklist
+
+
 class TestChecklistStorage(unittest.TestCase):
     """Tests for ChecklistStorage class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create a scratch directory for all tests in this class"""
+        cls._tmpdir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the scratch directory, including any backup files"""
+        shutil.rmtree(cls._tmpdir, ignore_errors=True)
+
     def setUp(self):
         """Set up test fixtures"""
-        # Create temporary file for testing
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        self.temp_file.close()
-        self.storage = ChecklistStorage(self.temp_file.name)
-
-    def tearDown(self):
-        """Clean up test files"""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
-
-        # Clean up any backup files
-        backup_pattern = f"{self.temp_file.name}.backup_"
-        dir_path = os.path.dirname(self.temp_file.name)
-        for file in os.listdir(dir_path):
-            if file.startswith(os.path.basename(self.temp_file.name) + ".backup_"):
-                os.unlink(os.path.join(dir_path, file))
+        # Empty per-test file; tests expect it to exist initially
+        self.temp_file_name = os.path.join(self._tmpdir, f"{self.id()}.json")
+        open(self.temp_file_name, 'w').close()
+        self.storage = ChecklistStorage(self.temp_file_name,
+                                        serializer=_InMemorySerializer)
+
+    def _write_saved_checklist(self):
+        """Put a saved empty checklist on disk without re-serializing it"""
+        with open(self.temp_file_name, 'wb') as f:
+            f.write(_serialized_empty_checklist())
 
     def test_init_with_default_path(self):
         """Test initialization with default path"""
@@ -49,7 +93,7 @@ class TestChecklistStorage(unittest.TestCase):
 
     def test_init_with_custom_path(self):
         """Test initialization with custom path"""
-        self.assertEqual(self.storage.get_file_path(), self.temp_file.name)
+        self.assertEqual(self.storage.get_file_path(), self.temp_file_name)
 
     def test_save_and_load_empty_checklist(self):
         """Test saving and loading an empty checklist"""
@@ -63,14 +107,7 @@ class TestChecklistStorage(unittest.TestCase):
 
     def test_save_and_load_checklist_with_data(self):
         """Test saving and loading a checklist with data"""
-        # Create checklist with data
-        checklist = Checklist()
-        cat1 = Category(1, "Work")
-        task1 = Task("Complete project", completed=False, notes=["Important"])
-        task1.add_subtask(Subtask("Write code"))
-        cat1.add_task(task1)
-        checklist.add_category(cat1)
-        checklist.set_current_category(1)
+        checklist = _make_checklist_with_data()
 
         # Save
         result = self.storage.save_checklist(checklist)
@@ -97,7 +134,7 @@ class TestChecklistStorage(unittest.TestCase):
 
     def test_load_nonexistent_file(self):
         """Test loading from a non-existent file"""
-        os.unlink(self.temp_file.name)
+        os.unlink(self.temp_file_name)
         loaded = self.storage.load_checklist()
         self.assertIsNone(loaded)
 
@@ -107,7 +144,7 @@ class TestChecklistStorage(unittest.TestCase):
         self.assertTrue(self.storage.file_exists())
 
         # Remove file
-        os.unlink(self.temp_file.name)
+        os.unlink(self.temp_file_name)
         self.assertFalse(self.storage.file_exists())
 
     def test_set_file_path(self):
@@ -123,8 +160,8 @@ class TestChecklistStorage(unittest.TestCase):
         self.assertGreater(checklist.get_category_count(), 0)
         self.assertIsNotNone(checklist.current_category_id)
 
-    def test_export_to_markdown(self):
-        """Test exporting to markdown"""
+    def test_markdown_content(self):
+        """Test the markdown generated for export"""
         # Create checklist with data
         checklist = Checklist()
         cat1 = Category(1, "Work")
@@ -136,93 +173,141 @@ class TestChecklistStorage(unittest.TestCase):
         cat1.add_task(task2)
         checklist.add_category(cat1)
 
-        # Export
-        md_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md')
-        md_file.close()
-
-        try:
-            result = self.storage.export_to_markdown(checklist, md_file.name)
-            self.assertTrue(result)
-
-            # Read and verify
-            with open(md_file.name, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            self.assertIn("# Checklist Export", content)
-            self.assertIn("## Work", content)
-            self.assertIn("[x] Task 1", content)
-            self.assertIn("[ ] Task 2", content)
-            self.assertIn("[x] Sub 1", content)
-            self.assertIn("[ ] Sub 2", content)
-        finally:
-            if os.path.exists(md_file.name):
-                os.unlink(md_file.name)
+        content = self.storage._generate_markdown(checklist)
+
+        self.assertIn("# Checklist Export", content)
+        self.assertIn("## Work", content)
+        self.assertIn("[x] Task 1", content)
+        self.assertIn("[ ] Task 2", content)
+        self.assertIn("[x] Sub 1", content)
+        self.assertIn("[ ] Sub 2", content)
 
     def test_backup_file(self):
         """Test creating a backup"""
-        # Create and save a checklist
-        checklist = Checklist()
-        self.storage.save_checklist(checklist)
+        # Start from a saved checklist
+        self._write_saved_checklist()
 
         # Create backup
         result = self.storage.backup_file("test_backup")
         self.assertTrue(result)
 
         # Check backup exists
-        backup_path = f"{self.temp_file.name}.test_backup"
+        backup_path = f"{self.temp_file_name}.test_backup"
         self.assertTrue(os.path.exists(backup_path))
 
-        # Clean up
-        os.unlink(backup_path)
-
     def test_backup_nonexistent_file(self):
         """Test backing up a non-existent file"""
-        os.unlink(self.temp_file.name)
+        os.unlink(self.temp_file_name)
         result = self.storage.backup_file()
         self.assertFalse(result)
 
     def test_get_file_size(self):
         """Test getting file size"""
-        # Empty file
-        checklist = Checklist()
-        self.storage.save_checklist(checklist)
+        # Saved empty checklist
+        self._write_saved_checklist()
         size = self.storage.get_file_size()
         self.assertGreater(size, 0)
 
         # Non-existent file
-        os.unlink(self.temp_file.name)
+        os.unlink(self.temp_file_name)
         size = self.storage.get_file_size()
         self.assertEqual(size, 0)
 
     def test_get_last_modified(self):
         """Test getting last modified time"""
-        checklist = Checklist()
-        self.storage.save_checklist(checklist)
+        self._write_saved_checklist()
 
         last_mod = self.storage.get_last_modified()
         self.assertIsNotNone(last_mod)
         self.assertIsInstance(last_mod, datetime)
 
         # Non-existent file
-        os.unlink(self.temp_file.name)
+        os.unlink(self.temp_file_name)
         last_mod = self.storage.get_last_modified()
         self.assertIsNone(last_mod)
 
 
+class TestChecklistStorageJSON(unittest.TestCase):
+    """End-to-end ChecklistStorage test through the real JSON codec"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create a scratch directory for all tests in this class"""
+        cls._tmpdir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the scratch directory"""
+        shutil.rmtree(cls._tmpdir, ignore_errors=True)
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.storage = ChecklistStorage(
+            os.path.join(self._tmpdir, f"{self.id()}.json"))
+
+    def test_save_and_load_json(self):
+        """Test the saved file is JSON and loads back to the same checklist"""
+        checklist = _make_checklist_with_data()
+        self.assertTrue(self.storage.save_checklist(checklist))
+
+        with open(self.storage.get_file_path(), 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), checklist.to_dict())
+
+        loaded = self.storage.load_checklist()
+        self.assertEqual(loaded.to_dict(), checklist.to_dict())
+
+
+@unittest.skipUnless(os.environ.get("REAL_IO"), "set REAL_IO=1 to run real-disk smoke tests")
+class TestChecklistStorageRealIO(unittest.TestCase):
+    """Smoke test of ChecklistStorage against the real filesystem"""
+
+    def test_save_and_load_real_file(self):
+        """Test a save/load round trip through a real file"""
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir, ignore_errors=True)
+        storage = ChecklistStorage(os.path.join(tmpdir, 'checklist.json'))
+
+        checklist = Checklist()
+        checklist.add_category(Category(1, "Work"))
+        self.assertTrue(storage.save_checklist(checklist))
+
+        loaded = storage.load_checklist()
+        self.assertEqual(loaded.get_category(1).name, "Work")
+
+    def test_export_to_markdown_real_file(self):
+        """Test that export_to_markdown writes the generated markdown"""
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir, ignore_errors=True)
+        storage = ChecklistStorage(os.path.join(tmpdir, 'checklist.json'))
+        md_path = os.path.join(tmpdir, 'checklist.md')
+
+        checklist = Checklist()
+        checklist.add_category(Category(1, "Work"))
+        self.assertTrue(storage.export_to_markdown(checklist, md_path))
+
+        with open(md_path, 'r', encoding='utf-8') as f:
+            self.assertIn("## Work", f.read())
+
+
 class TestSettingsManager(unittest.TestCase):
     """Tests for SettingsManager class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create a scratch directory for all tests in this class"""
+        cls._tmpdir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the scratch directory"""
+        shutil.rmtree(cls._tmpdir, ignore_errors=True)
+
     def setUp(self):
         """Set up test fixtures"""
-        # Create temporary file for testing
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        self.temp_file.close()
-        self.settings_manager = SettingsManager(self.temp_file.name)
-
-    def tearDown(self):
-        """Clean up test files"""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+        # Per-test settings path; the manager creates the file on first save.
+        # Autosave is off so tests write only when they call save_settings().
+        self.temp_file_name = os.path.join(self._tmpdir, f"{self.id()}.json")
+        self.settings_manager = SettingsManager(self.temp_file_name, autosave=False)
 
     def test_init_creates_default_settings(self):
         """Test initialization creates default settings"""
@@ -234,11 +319,21 @@ class TestSettingsManager(unittest.TestCase):
         """Test saving and loading settings"""
         self.settings_manager.set_input_bg_color('#FF0000')
         self.settings_manager.add_recent_file('/path/to/file.json')
+        self.assertTrue(self.settings_manager.save_settings())
+
+        # Re-read from the same file
+        self.assertTrue(self.settings_manager.reload())
+        self.assertEqual(self.settings_manager.get_input_bg_color(), '#FF0000')
+        self.assertIn('/path/to/file.json', self.settings_manager.get_recent_files())
 
-        # Create new manager with same file
-        new_manager = SettingsManager(self.temp_file.name)
-        self.assertEqual(new_manager.get_input_bg_color(), '#FF0000')
-        self.assertIn('/path/to/file.json', new_manager.get_recent_files())
+    def test_autosave(self):
+        """Test that changes hit the file immediately only with autosave on"""
+        self.settings_manager.set_input_bg_color('#FF0000')
+        self.assertFalse(os.path.exists(self.temp_file_name))
+
+        manager = SettingsManager(self.temp_file_name)
+        manager.set_input_bg_color('#00FF00')
+        self.assertTrue(os.path.exists(self.temp_file_name))
 
     def test_get_and_set_input_bg_color(self):
         """Test getting and setting input background color"""
@@ -269,13 +364,22 @@ class TestSettingsManager(unittest.TestCase):
     def test_recent_files_max_limit(self):
         """Test recent files respects max limit"""
         # Add more than max
-        for i in range(15):
-            self.settings_manager.add_recent_file(f'/path/to/file{i}.json')
+        self.settings_manager.add_recent_files_bulk(
+            [f'/path/to/file{i}.json' for i in range(15)])
 
         recent = self.settings_manager.get_recent_files()
         self.assertEqual(len(recent), 10)  # Max 10
         self.assertEqual(recent[0], '/path/to/file14.json')  # Most recent
 
+    def test_add_recent_files_bulk_matches_sequential(self):
+        """Test bulk add gives the same order as adding one at a time"""
+        paths = ['/a.json', '/b.json', '/a.json', '/c.json']
+        self.settings_manager.add_recent_file('/c.json')
+        self.settings_manager.add_recent_files_bulk(paths)
+
+        self.assertEqual(self.settings_manager.get_recent_files(),
+                         ['/c.json', '/a.json', '/b.json'])
+
     def test_remove_recent_file(self):
         """Test removing a recent file"""
         self.settings_manager.add_recent_file('/path/to/file1.json')
@@ -303,27 +407,24 @@ class TestSettingsManager(unittest.TestCase):
 
     def test_get_recent_files_existing(self):
         """Test getting only existing recent files"""
-        # Create a temporary file that exists
-        temp = tempfile.NamedTemporaryFile(delete=False)
-        temp.close()
+        # Create a file that exists; tearDownClass removes the directory
+        existing_path = os.path.join(self._tmpdir, f"{self.id()}.exists")
+        open(existing_path, 'w').close()
 
-        self.settings_manager.add_recent_file(temp.name)
+        self.settings_manager.add_recent_file(existing_path)
         self.settings_manager.add_recent_file('/nonexistent/file.json')
 
         existing = self.settings_manager.get_recent_files_existing()
         self.assertEqual(len(existing), 1)
-        self.assertEqual(existing[0], temp.name)
-
-        # Clean up
-        os.unlink(temp.name)
+        self.assertEqual(existing[0], existing_path)
 
     def test_cleanup_recent_files(self):
         """Test cleaning up non-existent recent files"""
-        # Create a temporary file that exists
-        temp = tempfile.NamedTemporaryFile(delete=False)
-        temp.close()
+        # Create a file that exists; tearDownClass removes the directory
+        existing_path = os.path.join(self._tmpdir, f"{self.id()}.exists")
+        open(existing_path, 'w').close()
 
-        self.settings_manager.add_recent_file(temp.name)
+        self.settings_manager.add_recent_file(existing_path)
         self.settings_manager.add_recent_file('/nonexistent1.json')
         self.settings_manager.add_recent_file('/nonexistent2.json')
 
@@ -332,10 +433,7 @@ class TestSettingsManager(unittest.TestCase):
 
         recent = self.settings_manager.get_recent_files()
         self.assertEqual(len(recent), 1)
-        self.assertEqual(recent[0], temp.name)
-
-        # Clean up
-        os.unlink(temp.name)
+        self.assertEqual(recent[0], existing_path)
 
     def test_get_and_set_setting(self):
         """Test generic get/set setting"""
@@ -358,6 +456,14 @@ class TestSettingsManager(unittest.TestCase):
         self.assertNotEqual(self.settings_manager.get_input_bg_color(), '#FF0000')
         self.assertEqual(len(self.settings_manager.get_recent_files()), 0)
 
+    def test_defaults_not_shared(self):
+        """Test that in-place edits never leak into the default settings"""
+        self.settings_manager.reset_to_defaults()
+        self.settings_manager.settings['recent_files'].append('/leak.json')
+
+        self.settings_manager.reset_to_defaults()
+        self.assertEqual(self.settings_manager.get_recent_files(), [])
+
     def test_get_all_settings(self):
         """Test getting all settings"""
         all_settings = self.settings_manager.get_all_settings()
@@ -373,14 +479,15 @@ class TestSettingsManager(unittest.TestCase):
         # Export
         exported = self.settings_manager.export_settings()
 
-        # Create new manager and import
-        new_manager = SettingsManager(self.temp_file.name)
-        new_manager.reset_to_defaults()
-        new_manager.import_settings(exported)
+        # Reset, import, then re-read from file
+        self.settings_manager.reset_to_defaults()
+        self.settings_manager.import_settings(exported)
+        self.settings_manager.save_settings()
+        self.settings_manager.reload()
 
-        self.assertEqual(new_manager.get_input_bg_color(), '#FF0000')
-        self.assertIn('/path/to/file.json', new_manager.get_recent_files())
+        self.assertEqual(self.settings_manager.get_input_bg_color(), '#FF0000')
+        self.assertIn('/path/to/file.json', self.settings_manager.get_recent_files())
 
 
 if __name__ == '__main__':
-    unittest.main()
+    unittest.main(buffer=True, failfast=os.environ.get("CI") == "true", verbosity=1)
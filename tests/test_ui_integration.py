@@ -3,176 +3,161 @@ Integration tests for UI components and application flow
 Tests the refactored UI modules working together with the application
 """
 
+import functools
+import importlib
 import unittest
 import sys
 import os
-import tempfile
-import json
+from contextlib import suppress
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add src to path for imports (once, even if this module is imported again)
+_SRC_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if _SRC_ROOT not in sys.path:
+    sys.path.insert(0, _SRC_ROOT)
 
 
-class MockTkWidget:
-    """Mock Tkinter widget for testing without GUI"""
+@functools.lru_cache(maxsize=None)
+def _json_codec():
+    """
+    Get (dumps, loads) functions that work on JSON bytes
 
-    def __init__(self, parent=None, **kwargs):
-        self.parent = parent
-        self.kwargs = kwargs
-        self.children = []
-        self.bindings = {}
-        self.packed = False
-        self.gridded = False
-        self._config = {}
+    Imported on first use so only the data-flow tests pay for it. orjson is
+    faster when installed; the stdlib json module works the same here.
+    """
+    try:
+        import orjson
+        return orjson.dumps, orjson.loads
+    except ImportError:
+        import json
+        return (lambda obj: json.dumps(obj).encode('utf-8')), json.loads
 
-    def pack(self, **kwargs):
-        self.packed = True
-        self.pack_config = kwargs
 
-    def grid(self, **kwargs):
-        self.gridded = True
-        self.grid_config = kwargs
+# Creation timestamp shared by the task fixtures below
+_FIXED_DT = '2025-01-01T10:00:00'
 
-    def bind(self, sequence, func):
-        self.bindings[sequence] = func
-
-    def config(self, **kwargs):
-        self._config.update(kwargs)
-
-    def winfo_children(self):
-        return self.children
-
-    def destroy(self):
-        self.children = []
-
-
-class TestUIComponentIntegration(unittest.TestCase):
-    """Integration tests for UI components"""
+# Sample data shared by the read-only tests below
+_OLD_FORMAT_DATA = {
+    'categories': [
+        {
+            'id': 1,
+            'name': 'Work',
+            'tasks': [
+                {
+                    'text': 'Task 1',
+                    'completed': False,
+                    'notes': ['Note 1'],
+                    'subtasks': [
+                        {'text': 'Subtask 1', 'completed': False}
+                    ],
+                    'created': _FIXED_DT
+                }
+            ]
+        }
+    ],
+    'current_category': 1
+}
 
-    def test_dialogs_import(self):
-        """Test that dialog components can be imported"""
-        try:
-            from src.ui.dialogs import AddCategoryDialog, AddSubtaskDialog
-            self.assertTrue(True)
-        except ImportError as e:
-            # Skip if tkinter not available
-            if 'tkinter' in str(e).lower():
-                self.skipTest("Tkinter not available in this environment")
-            else:
-                raise
+_EXPORT_SAMPLE = {
+    'categories': [
+        {
+            'id': 1,
+            'name': 'Work',
+            'tasks': [
+                {
+                    'text': 'Task 1',
+                    'completed': True,
+                    'notes': ['Note 1'],
+                    'subtasks': [
+                        {'text': 'Subtask 1', 'completed': True},
+                        {'text': 'Subtask 2', 'completed': False}
+                    ]
+                },
+                {
+                    'text': 'Task 2',
+                    'completed': False,
+                    'notes': []
+                }
+            ]
+        }
+    ]
+}
 
-    def test_input_area_import(self):
-        """Test that input area component can be imported"""
-        try:
-            from src.ui.input_area import InputArea
-            self.assertTrue(True)
-        except ImportError as e:
-            if 'tkinter' in str(e).lower():
-                self.skipTest("Tkinter not available in this environment")
-            else:
-                raise
 
-    def test_sidebar_import(self):
-        """Test that sidebar component can be imported"""
+def skip_if_no_tkinter(method):
+    """Skip the current test when the decorated method hits a missing tkinter"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
         try:
-            from src.ui.sidebar import Sidebar
-            self.assertTrue(True)
+            return method(self, *args, **kwargs)
         except ImportError as e:
             if 'tkinter' in str(e).lower():
                 self.skipTest("Tkinter not available in this environment")
-            else:
-                raise
+            raise
+    return wrapper
 
-    def test_task_panel_import(self):
-        """Test that task panel component can be imported"""
-        try:
-            from src.ui.task_panel import TaskPanel
-            self.assertTrue(True)
-        except ImportError as e:
-            if 'tkinter' in str(e).lower():
-                self.skipTest("Tkinter not available in this environment")
-            else:
-                raise
 
-    def test_main_window_import(self):
-        """Test that main window component can be imported"""
-        try:
-            from src.ui.main_window import MainWindow
-            self.assertTrue(True)
-        except ImportError as e:
-            if 'tkinter' in str(e).lower():
-                self.skipTest("Tkinter not available in this environment")
-            else:
-                raise
+class TestUIComponentIntegration(unittest.TestCase):
+    """Integration tests for UI components"""
 
-    def test_ui_package_exports(self):
-        """Test that UI package exports all components"""
-        try:
-            from src.ui import (
-                AddCategoryDialog,
-                AddSubtaskDialog,
-                InputArea,
-                Sidebar,
-                TaskPanel,
-                MainWindow
-            )
-            self.assertTrue(True)
-        except ImportError as e:
-            if 'tkinter' in str(e).lower():
-                self.skipTest("Tkinter not available in this environment")
-            else:
-                raise
+    # Module -> names it must provide; 'src.ui' checks the package re-exports
+    UI_EXPORTS = (
+        ('src.ui.dialogs', ('AddCategoryDialog', 'AddSubtaskDialog')),
+        ('src.ui.input_area', ('InputArea',)),
+        ('src.ui.sidebar', ('Sidebar',)),
+        ('src.ui.task_panel', ('TaskPanel',)),
+        ('src.ui.main_window', ('MainWindow',)),
+        ('src.ui', ('AddCategoryDialog', 'AddSubtaskDialog', 'InputArea',
+                    'Sidebar', 'TaskPanel', 'MainWindow')),
+    )
+
+    @skip_if_no_tkinter
+    def _import_ui_module(self, mod):
+        """Import a UI module, skipping the current (sub)test without tkinter"""
+        return importlib.import_module(mod)
+
+    def test_ui_imports(self):
+        """Test that each UI module can be imported and exports its components"""
+        for mod, names in self.UI_EXPORTS:
+            with self.subTest(mod=mod):
+                module = self._import_ui_module(mod)
+                for name in names:
+                    self.assertTrue(hasattr(module, name), f"{mod} has no {name}")
 
 
 class TestApplicationDataFlow(unittest.TestCase):
     """Test application data flow and integration"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        # Create temporary file for testing
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        self.temp_file.close()
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary file shared by the tests in this class"""
+        import tempfile
+
+        # Tests that write to it open it in 'w'/'wb' mode, which truncates
+        cls.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
+        cls.temp_file.close()
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test files"""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+        with suppress(FileNotFoundError):
+            os.unlink(cls.temp_file.name)
 
     def test_data_structure_compatibility(self):
         """Test that old data structure is compatible with new modules"""
-        # Create old-style data structure
-        old_data = {
-            'categories': [
-                {
-                    'id': 1,
-                    'name': 'Work',
-                    'tasks': [
-                        {
-                            'text': 'Task 1',
-                            'completed': False,
-                            'notes': ['Note 1'],
-                            'subtasks': [
-                                {'text': 'Subtask 1', 'completed': False}
-                            ],
-                            'created': '2025-01-01T10:00:00'
-                        }
-                    ]
-                }
-            ],
-            'current_category': 1
-        }
+        dumps, loads = _json_codec()
 
-        # Save to file
-        with open(self.temp_file.name, 'w') as f:
-            json.dump(old_data, f)
+        # Save old-style data to file
+        with open(self.temp_file.name, 'wb') as f:
+            f.write(dumps(_OLD_FORMAT_DATA))
 
         # Load and verify
-        with open(self.temp_file.name, 'r') as f:
-            loaded_data = json.load(f)
+        with open(self.temp_file.name, 'rb') as f:
+            loaded_data = loads(f.read())
 
-        self.assertEqual(loaded_data['categories'][0]['id'], 1)
-        self.assertEqual(loaded_data['categories'][0]['name'], 'Work')
-        self.assertEqual(len(loaded_data['categories'][0]['tasks']), 1)
+        category = loaded_data['categories'][0]
+        self.assertEqual(category['id'], 1)
+        self.assertEqual(category['name'], 'Work')
+        self.assertEqual(len(category['tasks']), 1)
         self.assertEqual(loaded_data['current_category'], 1)
 
     def test_category_operations(self):
@@ -186,12 +171,12 @@ class TestApplicationDataFlow(unittest.TestCase):
         }
 
         # Add category
-        new_id = max([c['id'] for c in data['categories']], default=0) + 1
+        new_id = max((c['id'] for c in data['categories']), default=0) + 1
         data['categories'].append({'id': new_id, 'name': 'Shopping', 'tasks': []})
         self.assertEqual(len(data['categories']), 3)
 
         # Delete category
-        data['categories'] = [c for c in data['categories'] if c['id'] != 2]
+        data['categories'][:] = [c for c in data['categories'] if c['id'] != 2]
         self.assertEqual(len(data['categories']), 2)
 
         # Reorder categories
@@ -212,13 +197,14 @@ class TestApplicationDataFlow(unittest.TestCase):
             'text': 'New task',
             'completed': False,
             'notes': [],
-            'created': '2025-01-01T10:00:00'
+            'created': _FIXED_DT
         })
         self.assertEqual(len(category['tasks']), 1)
 
         # Toggle task
-        category['tasks'][0]['completed'] = not category['tasks'][0]['completed']
-        self.assertTrue(category['tasks'][0]['completed'])
+        task = category['tasks'][0]
+        task['completed'] = not task['completed']
+        self.assertTrue(task['completed'])
 
         # Delete task
         del category['tasks'][0]
@@ -239,8 +225,9 @@ class TestApplicationDataFlow(unittest.TestCase):
         self.assertEqual(len(task['subtasks']), 2)
 
         # Toggle subtask
-        task['subtasks'][0]['completed'] = not task['subtasks'][0]['completed']
-        self.assertTrue(task['subtasks'][0]['completed'])
+        subtask = task['subtasks'][0]
+        subtask['completed'] = not subtask['completed']
+        self.assertTrue(subtask['completed'])
 
         # Delete subtask
         del task['subtasks'][0]
@@ -259,61 +246,39 @@ class TestApplicationDataFlow(unittest.TestCase):
         }
 
         # Clear completed
-        category['tasks'] = [t for t in category['tasks'] if not t['completed']]
+        category['tasks'][:] = [t for t in category['tasks'] if not t['completed']]
         self.assertEqual(len(category['tasks']), 1)
         self.assertEqual(category['tasks'][0]['text'], 'Task 2')
 
     def test_export_markdown_structure(self):
         """Test markdown export data structure"""
-        data = {
-            'categories': [
-                {
-                    'id': 1,
-                    'name': 'Work',
-                    'tasks': [
-                        {
-                            'text': 'Task 1',
-                            'completed': True,
-                            'notes': ['Note 1'],
-                            'subtasks': [
-                                {'text': 'Subtask 1', 'completed': True},
-                                {'text': 'Subtask 2', 'completed': False}
-                            ]
-                        },
-                        {
-                            'text': 'Task 2',
-                            'completed': False,
-                            'notes': []
-                        }
-                    ]
-                }
-            ]
-        }
+        data = _EXPORT_SAMPLE
 
         # Generate markdown
-        markdown = "# Checklist Export\n\n"
+        parts = ["# Checklist Export\n\n"]
         for category in data['categories']:
-            markdown += f"## {category['name']}\n\n"
+            parts.append(f"## {category['name']}\n\n")
             for task in category['tasks']:
                 checkbox = '[x]' if task['completed'] else '[ ]'
-                markdown += f"- {checkbox} {task['text']}\n"
+                parts.append(f"- {checkbox} {task['text']}\n")
 
-                if task.get('subtasks'):
-                    for subtask in task['subtasks']:
-                        sub_checkbox = '[x]' if subtask['completed'] else '[ ]'
-                        markdown += f"  - {sub_checkbox} {subtask['text']}\n"
+                for subtask in task.get('subtasks', ()):
+                    sub_checkbox = '[x]' if subtask['completed'] else '[ ]'
+                    parts.append(f"  - {sub_checkbox} {subtask['text']}\n")
 
-                if task.get('notes'):
-                    for note in task['notes']:
-                        markdown += f"    - {note}\n"
+                for note in task.get('notes', ()):
+                    parts.append(f"    - {note}\n")
+        markdown = "".join(parts)
 
-        # Verify markdown contains expected elements
-        self.assertIn("## Work", markdown)
-        self.assertIn("[x] Task 1", markdown)
-        self.assertIn("[ ] Task 2", markdown)
-        self.assertIn("[x] Subtask 1", markdown)
-        self.assertIn("[ ] Subtask 2", markdown)
-        self.assertIn("Note 1", markdown)
+        # Verify markdown contains the expected lines
+        lines = set(markdown.splitlines())
+        for expected in ("## Work",
+                         "- [x] Task 1",
+                         "- [ ] Task 2",
+                         "  - [x] Subtask 1",
+                         "  - [ ] Subtask 2",
+                         "    - Note 1"):
+            self.assertIn(expected, lines)
 
 
 class TestSettingsIntegration(unittest.TestCase):
@@ -336,14 +301,11 @@ class TestSettingsIntegration(unittest.TestCase):
         self.assertEqual(len(settings['recent_files']), 2)
         self.assertEqual(settings['recent_files'][0], '/path/to/file2.json')
 
-        # Remove duplicates
-        if '/path/to/file1.json' in settings['recent_files']:
-            settings['recent_files'].remove('/path/to/file1.json')
-        settings['recent_files'].insert(0, '/path/to/file1.json')
-        self.assertEqual(len(settings['recent_files']), 2)
-
-        # Limit recent files
-        settings['recent_files'] = settings['recent_files'][:10]
+        # Re-add an existing file: move it to the front, drop duplicates, cap at 10
+        settings['recent_files'] = list(dict.fromkeys(
+            ['/path/to/file1.json'] + settings['recent_files']))[:10]
+        self.assertEqual(settings['recent_files'],
+                         ['/path/to/file1.json', '/path/to/file2.json'])
         self.assertLessEqual(len(settings['recent_files']), 10)
 
 
@@ -373,14 +335,13 @@ class TestDataMigration(unittest.TestCase):
         # Migrate
         for category in data.get('categories', []):
             for task in category.get('tasks', []):
-                if 'subtasks' in task:
-                    for subtask in task['subtasks']:
-                        if 'completed' not in subtask:
-                            subtask['completed'] = False
+                for subtask in task.get('subtasks', ()):
+                    subtask.setdefault('completed', False)
 
         # Verify
-        self.assertIn('completed', data['categories'][0]['tasks'][0]['subtasks'][0])
-        self.assertFalse(data['categories'][0]['tasks'][0]['subtasks'][0]['completed'])
+        subtask = data['categories'][0]['tasks'][0]['subtasks'][0]
+        self.assertIn('completed', subtask)
+        self.assertFalse(subtask['completed'])
 
     def test_migrate_current_category(self):
         """Test migrating current_category field"""
@@ -401,4 +362,4 @@ class TestDataMigration(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    unittest.main()
+    unittest.main(buffer=True, failfast=os.environ.get("CI") == "true", verbosity=1)